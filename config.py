@@ -336,6 +336,12 @@ TOTAL_SHEET_COLUMNS = [
     '집행률'
 ]
 
+# 연구비 요약의 연구개발비/유형자산 행 집계용 키워드 (예산과목 또는 적요에 포함 시 매칭)
+RESEARCH_EXPENSE_KEYWORDS = {
+    '연구개발비': ['연구개발비', '연구비', '연구개발'],
+    '자산취득비': ['자산취득비', '자산취득', '유형자산', '장비구입', '기자재']
+}
+
 # xlwings 대화형 피벗 테이블 설정
 ENABLE_INTERACTIVE_PIVOT = True  # 대화형 피벗 테이블 활성화 여부
 PIVOT_SHEET_NAME = '예산분석'
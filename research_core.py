@@ -8,11 +8,15 @@
 """
 
 import os
+import re
+import sys
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, Optional, List, Tuple
 from openpyxl.chart import BarChart, PieChart, DoughnutChart, LineChart, Reference
 from openpyxl.chart.label import DataLabelList
+from openpyxl.drawing.fill import SolidColorFillProperties
 from openpyxl.formatting.rule import DataBarRule, ColorScaleRule, IconSetRule
 from openpyxl.formatting import Rule
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
@@ -21,9 +25,32 @@ from config import (
     BUSINESS_PREFIX, RESEARCH_PREFIX, SUPPORTED_EXTENSIONS,
     SUMMARY_COLUMN, UNCLASSIFIED_WARNING_THRESHOLD,
     OUTPUT_SHEET_NAMES, OUTPUT_COLUMNS, RESEARCH_ADDITIONAL_COLUMNS,
-    EXCEL_STYLING, BUDGET_CLASSIFICATION, SUMMARY_SHEET_COLUMNS, TOTAL_SHEET_COLUMNS
+    EXCEL_STYLING, BUDGET_CLASSIFICATION, SUMMARY_SHEET_COLUMNS, TOTAL_SHEET_COLUMNS,
+    RESEARCH_EXPENSE_KEYWORDS
 )
 
+logger = logging.getLogger(__name__)
+
+
+# 적요 파싱용 정규식 (25 심층연구(주제) 패턴의 주제 / _ 뒤의 한글 연구자 이름)
+TOPIC_RE = re.compile(r'25 심층연구\(([^)]+)\)')
+RESEARCHER_RE = re.compile(r'_([가-힣]+)')
+
+# 총액 시트 집계가 비었을 때 반환하는 공용 빈 결과 (호출부는 읽기만 하므로 수정 금지)
+_EMPTY_CENTER_SUMMARY = pd.DataFrame(columns=['예산과목', '센터'])
+_EMPTY_RESEARCH_SUMMARY = pd.DataFrame(columns=['예산과목', '심층연구'])
+
+
+def _extract_summary_field(summaries: pd.Series, pattern: re.Pattern) -> pd.Series:
+    '''적요 컬럼 전체에서 정규식의 첫 번째 그룹을 추출합니다. (문자열이 아니거나 매칭이 없으면 빈 문자열)'''
+    try:
+        text = summaries.str
+    except AttributeError:
+        # 문자열 값이 하나도 없는 컬럼
+        return pd.Series('', index=summaries.index, dtype=object)
+
+    return text.extract(pattern, expand=False).fillna('')
+
 
 class ExcelFileLoader:
     '''Excel 파일 로더 클래스'''
@@ -200,15 +227,12 @@ class ExcelExporter:
 
                 # 1. 대시보드 시트 생성 (첫 번째)
                 if not total_sheet.empty:
-                    dashboard_sheet = dashboard_generator.generate_dashboard_sheet(total_sheet)
-                    dashboard_sheet.to_excel(
-                        writer,
-                        sheet_name='대시보드',
-                        index=False
-                    )
+                    dashboard_generator.generate_dashboard_sheet(total_sheet)
+                    # 대시보드는 셀을 직접 기록하므로 빈 DataFrame을 to_excel로 거치지 않고 워크시트를 바로 생성
+                    dashboard_worksheet = writer.book.create_sheet('대시보드')
                     # 대시보드 워크시트에 실제 대시보드 생성
                     dashboard_generator.create_dashboard_in_worksheet(
-                        writer.sheets['대시보드'],
+                        dashboard_worksheet,
                         total_sheet
                     )
                     
@@ -435,7 +459,7 @@ class ExcelExporter:
 
         # 연구자 정보 추출 (적요에서 _이름 형태로 추출)
         if '적요' in result.columns:
-            result['연구자'] = result['적요'].apply(self._extract_researcher_name)
+            result['연구자'] = _extract_summary_field(result['적요'], RESEARCHER_RE)
         else:
             result['연구자'] = ''
             logging.warning("적요 컬럼이 없어 연구자 정보를 추출할 수 없습니다.")
@@ -445,45 +469,6 @@ class ExcelExporter:
 
         return result
 
-    def _extract_researcher_name(self, summary_text: str) -> str:
-        '''적요에서 연구자 이름을 추출합니다.'''
-        if pd.isna(summary_text) or not isinstance(summary_text, str):
-            return ''
-
-        try:
-            # _ 뒤에 나오는 한글을 추출
-            import re
-            pattern = r'_([가-힣]+)'
-            match = re.search(pattern, summary_text)
-
-            if match:
-                return match.group(1)  # 한글 이름 부분만 반환
-            else:
-                return ''
-        except Exception as e:
-            logging.warning(f"연구자 이름 추출 중 오류: {str(e)}")
-            return ''
-
-    def _extract_research_topic(self, summary_text: str) -> str:
-        '''적요에서 연구주제를 추출합니다.'''
-        if pd.isna(summary_text) or not isinstance(summary_text, str):
-            return ''
-
-        try:
-            # 25 심층연구(주제) 패턴에서 주제 부분 추출
-            import re
-            pattern = r'25 심층연구\(([^)]+)\)'
-            match = re.search(pattern, summary_text)
-
-            if match:
-                topic = match.group(1)
-                return topic  # 원본 주제명 그대로 반환
-            else:
-                return ''
-        except Exception as e:
-            logging.warning(f"연구주제 추출 중 오류: {str(e)} - 적요: {summary_text}")
-            return ''
-
     def _format_date_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         '''날짜 컬럼의 형식을 처리합니다 (시간 제거).'''
         result = data.copy()
@@ -518,8 +503,6 @@ class ExcelExporter:
 
     def _apply_column_widths(self, worksheet, columns):
         '''컬럼 너비를 조정합니다.'''
-        from openpyxl.utils import get_column_letter
-
         for idx, column_name in enumerate(columns, 1):
             column_letter = get_column_letter(idx)
             width = EXCEL_STYLING['column_widths'].get(column_name, 12)  # 기본값 12
@@ -527,9 +510,6 @@ class ExcelExporter:
 
     def _apply_header_style(self, worksheet, columns):
         '''헤더 행에 스타일을 적용합니다.'''
-        from openpyxl.styles import PatternFill, Font
-        from openpyxl.utils import get_column_letter
-
         # 헤더 스타일 정의
         header_fill = PatternFill(
             start_color=EXCEL_STYLING['header_style']['fill_color'],
@@ -543,17 +523,13 @@ class ExcelExporter:
 
         # 첫 번째 행(헤더)에 스타일 적용
         for idx in range(1, len(columns) + 1):
-            column_letter = get_column_letter(idx)
-            cell = worksheet[f'{column_letter}1']
+            cell = worksheet.cell(row=1, column=idx)
             cell.fill = header_fill
             cell.font = header_font
 
     def _apply_summary_sheet_styling(self, worksheet, summary_data: pd.DataFrame):
         '''사업비 요약 시트에 특별한 스타일링을 적용합니다.'''
         try:
-            from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-
             # 컬럼 너비 설정
             column_widths = {
                 '예산목': 15,
@@ -584,8 +560,7 @@ class ExcelExporter:
 
             # 헤더 행 스타일링
             for idx in range(1, len(SUMMARY_SHEET_COLUMNS) + 1):
-                column_letter = get_column_letter(idx)
-                cell = worksheet[f'{column_letter}1']
+                cell = worksheet.cell(row=1, column=idx)
                 cell.fill = header_fill
                 cell.font = header_font
                 cell.alignment = Alignment(horizontal='center', vertical='center')
@@ -612,7 +587,7 @@ class ExcelExporter:
                     merge_range = f'A{start_row + 2}:A{end_row + 2}'  # +2는 헤더 행 때문
                     worksheet.merge_cells(merge_range)
                     # merge된 셀에 중앙 정렬 적용
-                    merged_cell = worksheet[f'A{start_row + 2}']
+                    merged_cell = worksheet.cell(row=start_row + 2, column=1)
                     merged_cell.alignment = Alignment(horizontal='center', vertical='center')
                     merged_cell.font = Font(bold=False)
 
@@ -622,7 +597,7 @@ class ExcelExporter:
                     merge_range = f'B{start_row + 2}:B{end_row + 2}'  # +2는 헤더 행 때문
                     worksheet.merge_cells(merge_range)
                     # merge된 셀에 중앙 정렬 적용
-                    merged_cell = worksheet[f'B{start_row + 2}']
+                    merged_cell = worksheet.cell(row=start_row + 2, column=2)
                     merged_cell.alignment = Alignment(horizontal='center', vertical='center')
                     merged_cell.font = Font(bold=False)
 
@@ -636,8 +611,7 @@ class ExcelExporter:
                     total_row_idx = row_idx
 
                 for col_idx in range(1, len(SUMMARY_SHEET_COLUMNS) + 1):
-                    column_letter = get_column_letter(col_idx)
-                    cell = worksheet[f'{column_letter}{row_idx}']
+                    cell = worksheet.cell(row=row_idx, column=col_idx)
                     cell.border = thin_border
 
                     # Excel 함수 적용
@@ -688,9 +662,6 @@ class ExcelExporter:
     def _apply_total_sheet_styling(self, worksheet, total_data: pd.DataFrame):
         '''총액 시트에 스타일링을 적용합니다.'''
         try:
-            from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-
             # 컬럼 너비 설정 (총액 시트용)
             column_widths = {
                 '예산목': 15,
@@ -719,8 +690,7 @@ class ExcelExporter:
 
             # 헤더 행 스타일링
             for idx in range(1, len(TOTAL_SHEET_COLUMNS) + 1):
-                column_letter = get_column_letter(idx)
-                cell = worksheet[f'{column_letter}1']
+                cell = worksheet.cell(row=1, column=idx)
                 cell.fill = header_fill
                 cell.font = header_font
 
@@ -733,7 +703,7 @@ class ExcelExporter:
                 if end_row > start_row:
                     merge_range = f'A{start_row + 2}:A{end_row + 2}'
                     worksheet.merge_cells(merge_range)
-                    merged_cell = worksheet[f'A{start_row + 2}']
+                    merged_cell = worksheet.cell(row=start_row + 2, column=1)
                     merged_cell.alignment = Alignment(horizontal='center', vertical='center')
                     merged_cell.font = Font(bold=False)
 
@@ -742,7 +712,7 @@ class ExcelExporter:
                 if end_row > start_row:
                     merge_range = f'B{start_row + 2}:B{end_row + 2}'
                     worksheet.merge_cells(merge_range)
-                    merged_cell = worksheet[f'B{start_row + 2}']
+                    merged_cell = worksheet.cell(row=start_row + 2, column=2)
                     merged_cell.alignment = Alignment(horizontal='center', vertical='center')
                     merged_cell.font = Font(bold=False)
 
@@ -751,8 +721,7 @@ class ExcelExporter:
                 row_data = total_data.iloc[row_idx - 2]
 
                 for col_idx in range(1, len(TOTAL_SHEET_COLUMNS) + 1):
-                    column_letter = get_column_letter(col_idx)
-                    cell = worksheet[f'{column_letter}{row_idx}']
+                    cell = worksheet.cell(row=row_idx, column=col_idx)
                     cell.border = thin_border
 
                     # Excel 함수 적용
@@ -1117,8 +1086,6 @@ class ExcelExporter:
         총합 표에 개별 표들을 참조하는 Excel 함수를 적용합니다.
         '''
         try:
-            from openpyxl.utils import get_column_letter
-
             # 총합 표 영역 식별 (표 제목 행 제외)
             total_table_start = None
             total_table_end = None
@@ -1138,13 +1105,14 @@ class ExcelExporter:
             individual_tables = [name for name in budget_item_mapping.keys()
                                if name != '총합']
 
-            # 총합 표의 각 예산과목에 대해 Excel 함수 적용
-            for idx in range(total_table_start, total_table_end + 1):
-                if idx >= len(summary_data):
-                    break
+            # 예산금액(D열)과 지출액(E열)의 컬럼 번호 (문자열 좌표 파싱 회피)
+            budget_col, expense_col = 4, 5
+            ws_cell = worksheet.cell
+            budget_items = summary_data['예산과목']
 
-                row = summary_data.iloc[idx]
-                budget_item = row['예산과목']
+            # 총합 표의 각 예산과목에 대해 Excel 함수 적용
+            for idx in range(total_table_start, min(total_table_end + 1, len(summary_data))):
+                budget_item = budget_items.iat[idx]
 
                 if budget_item and budget_item != '' and not pd.isna(budget_item):
                     excel_row = idx + 2  # Excel 행 번호
@@ -1156,9 +1124,9 @@ class ExcelExporter:
                         budget_item, individual_tables, budget_item_mapping, 'E')
 
                     if budget_formula:
-                        worksheet[f'D{excel_row}'].value = budget_formula
+                        ws_cell(row=excel_row, column=budget_col, value=budget_formula)
                     if expense_formula:
-                        worksheet[f'E{excel_row}'].value = expense_formula
+                        ws_cell(row=excel_row, column=expense_col, value=expense_formula)
 
             logging.info("총합 표 Excel 함수 적용 완료")
 
@@ -1171,13 +1139,9 @@ class ExcelExporter:
         특정 예산과목에 대한 SUM 함수를 생성합니다.
         '''
         try:
-            cell_references = []
-
-            for table_name in individual_tables:
-                table_mapping = budget_item_mapping.get(table_name, {})
-                if budget_item in table_mapping:
-                    row_number = table_mapping[budget_item]
-                    cell_references.append(f'{column}{row_number}')
+            table_mappings = [budget_item_mapping.get(table_name, {}) for table_name in individual_tables]
+            cell_references = [f'{column}{table_mapping[budget_item]}'
+                               for table_mapping in table_mappings if budget_item in table_mapping]
 
             if cell_references:
                 return f'=SUM({",".join(cell_references)})'
@@ -1193,18 +1157,23 @@ class ExcelExporter:
         연구비 요약 시트인지 확인합니다. (총합 표와 개별 표들이 있는지 확인)
         '''
         try:
+            budget_category = summary_data['예산목']
+            subcategory = summary_data['세목']
+            budget_item = summary_data['예산과목']
+
             # '총합' 제목 행이 있는지 확인
-            has_total_summary = any(row['예산목'] == '총합' for _, row in summary_data.iterrows())
+            is_total_title = budget_category == '총합'
+            has_total_summary = is_total_title.any()
 
             # 개별 표 제목 행이 있는지 확인 (예산목과 세목은 있지만 예산과목은 없는 행)
-            has_individual_tables = any(
-                (row['예산목'] and row['세목'] and
-                 (pd.isna(row['예산과목']) or row['예산과목'] == ''))
-                for _, row in summary_data.iterrows()
-                if row['예산목'] != '총합'
-            )
+            has_individual_tables = (
+                budget_category.notna() & (budget_category != '') &
+                subcategory.notna() & (subcategory != '') &
+                (budget_item.isna() | (budget_item == '')) &
+                ~is_total_title
+            ).any()
 
-            return has_total_summary and has_individual_tables
+            return bool(has_total_summary and has_individual_tables)
 
         except Exception as e:
             logging.error(f"연구비 시트 확인 중 오류: {str(e)}")
@@ -1218,44 +1187,25 @@ class SummarySheetGenerator:
         self.budget_classification = BUDGET_CLASSIFICATION
         self.summary_data = None
 
-    def _extract_research_topic(self, summary_text: str) -> str:
-        '''적요에서 연구주제를 추출합니다.'''
-        if pd.isna(summary_text) or not isinstance(summary_text, str):
-            return ''
-
-        try:
-            # 25 심층연구(주제) 패턴에서 주제 부분 추출
-            import re
-            pattern = r'25 심층연구\(([^)]+)\)'
-            match = re.search(pattern, summary_text)
-
-            if match:
-                topic = match.group(1)
-                return topic  # 원본 주제명 그대로 반환
-            else:
-                return ''
-        except Exception as e:
-            logging.warning(f"연구주제 추출 중 오류: {str(e)} - 적요: {summary_text}")
-            return ''
+        # 예산과목 부분 매칭용 정규식 (한 번만 컴파일)
+        self._budget_item_patterns = {
+            budget_item: re.compile(re.escape(budget_item), re.IGNORECASE)
+            for category_info in self.budget_classification['budget_categories'].values()
+            for budget_items in category_info['subcategories'].values()
+            for budget_item in budget_items
+        }
 
-    def _extract_researcher_name(self, summary_text: str) -> str:
-        '''적요에서 연구자 이름을 추출합니다.'''
-        if pd.isna(summary_text) or not isinstance(summary_text, str):
-            return ''
+        # 예산과목 → 예산금액 정확 매칭용 조회 테이블
+        self._budget_amount_lookup = pd.Series(self.budget_classification['2025_budget_amounts'], dtype='int64')
 
-        try:
-            # _ 뒤에 나오는 한글을 추출
-            import re
-            pattern = r'_([가-힣]+)'
-            match = re.search(pattern, summary_text)
+        # 빈 예산 구조 캐시 (최초 사용 시 생성)
+        self._empty_budget_structure = None
 
-            if match:
-                return match.group(1)  # 한글 이름 부분만 반환
-            else:
-                return ''
-        except Exception as e:
-            logging.warning(f"연구자 이름 추출 중 오류: {str(e)}")
-            return ''
+        # 연구비 카테고리별 키워드 매칭용 정규식 (한 번만 컴파일)
+        self._research_expense_patterns = {
+            category: re.compile('|'.join(map(re.escape, keywords)))
+            for category, keywords in RESEARCH_EXPENSE_KEYWORDS.items()
+        }
 
     def generate_summary_sheet(self, business_data: pd.DataFrame) -> pd.DataFrame:
         '''
@@ -1304,13 +1254,27 @@ class SummarySheetGenerator:
                 return pd.DataFrame()
 
             # 데이터 전처리
-            work_data = business_data.copy()
-            work_data['예산과목'] = work_data['예산과목'].fillna('미분류').astype(str)
-            work_data['총지급액'] = pd.to_numeric(work_data['총지급액'], errors='coerce').fillna(0)
+            amounts = pd.to_numeric(business_data['총지급액'], errors='coerce').fillna(0).to_numpy()
+            budget_item_values = business_data['예산과목']
+
+            # 예산과목별 지출액 집계 (예산과목 수가 적으므로 groupby 대신 NumPy로 직접 합산)
+            if isinstance(budget_item_values.dtype, pd.CategoricalDtype):
+                # 범주형이면 이미 계산된 범주 코드를 그대로 사용
+                budget_item_values = budget_item_values.cat.remove_unused_categories()
+                if budget_item_values.isna().any():
+                    if '미분류' not in budget_item_values.cat.categories:
+                        budget_item_values = budget_item_values.cat.add_categories('미분류')
+                    budget_item_values = budget_item_values.fillna('미분류')
+                budget_items = budget_item_values.cat.categories.astype(str).to_numpy()
+                inverse = budget_item_values.cat.codes.to_numpy()
+            else:
+                budget_item_values = budget_item_values.fillna('미분류').astype(str)
+                budget_items, inverse = np.unique(budget_item_values.to_numpy(), return_inverse=True)
+            expenses = np.bincount(inverse, weights=amounts, minlength=len(budget_items))
+            if amounts.dtype.kind in 'iu':
+                expenses = expenses.astype(amounts.dtype)
 
-            # 예산과목별 지출액 집계
-            expense_summary = work_data.groupby('예산과목')['총지급액'].sum().reset_index()
-            expense_summary.columns = ['예산과목', '지출액']
+            expense_summary = pd.DataFrame({'예산과목': budget_items, '지출액': expenses})
 
             logging.info(f"예산과목별 집계 완료: {len(expense_summary)}개 항목")
             return expense_summary
@@ -1341,10 +1305,10 @@ class SummarySheetGenerator:
                         if not exact_match.empty:
                             matching_rows = exact_match
                         else:
-                            # 정규식 특수문자 이스케이프 처리
-                            escaped_item = budget_item.replace('(', r'\(').replace(')', r'\)')
+                            # 미리 컴파일된 정규식으로 부분 매칭
                             matching_rows = expense_summary[
-                                expense_summary['예산과목'].str.contains(escaped_item, na=False, case=False, regex=True)
+                                expense_summary['예산과목'].str.contains(
+                                    self._budget_item_patterns[budget_item], na=False, regex=True)
                             ]
 
                         if not matching_rows.empty:
@@ -1394,10 +1358,20 @@ class SummarySheetGenerator:
             result_data = hierarchical_data.copy()
             default_budgets = self.budget_classification['2025_budget_amounts']
 
-            # 예산금액 설정
-            result_data['예산금액'] = result_data['예산과목'].apply(
-                lambda x: self._get_budget_amount(x, default_budgets)
-            )
+            # 예산금액 설정 (정확한 매칭은 조회 테이블로 한 번에 처리)
+            budget_items = result_data['예산과목']
+            budget_amounts = budget_items.map(self._budget_amount_lookup)
+
+            # 총액/부분 매칭이 필요한 예산과목만 고유값 단위로 계산
+            unmatched = budget_amounts.isna()
+            if unmatched.any():
+                fallback_amounts = {
+                    budget_item: self._get_budget_amount(budget_item, default_budgets)
+                    for budget_item in budget_items[unmatched].unique()
+                }
+                budget_amounts[unmatched] = budget_items[unmatched].map(fallback_amounts)
+
+            result_data['예산금액'] = budget_amounts.astype('int64')
 
             # 예산잔액 계산 (예산금액 - 지출액)
             result_data['예산잔액'] = result_data['예산금액'] - result_data['지출액']
@@ -1469,6 +1443,15 @@ class SummarySheetGenerator:
             else:
                 logging.error("적요 컬럼이 연구비 데이터에 없습니다!")
 
+            # 예산 분류 컬럼은 고유값이 적으므로 범주형으로 한 번 변환하여 이후 반복 비교/집계에 재사용
+            research_data = self._categorize_budget_columns(research_data)
+
+            # 총지급액도 숫자로 한 번만 변환하여 총합 표/개별 표 집계에서 재사용
+            if '총지급액' in research_data.columns:
+                research_data = research_data.assign(
+                    총지급액=pd.to_numeric(research_data['총지급액'], errors='coerce').fillna(0)
+                )
+
             # 1. 총합 표 생성
             total_summary = self._generate_total_summary(research_data)
             logging.info(f"총합 표 크기: {total_summary.shape}")
@@ -1488,6 +1471,18 @@ class SummarySheetGenerator:
             logging.error(f"연구비 요약 시트 생성 중 오류: {str(e)}")
             return pd.DataFrame(columns=SUMMARY_SHEET_COLUMNS)
 
+    def _categorize_budget_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        '''예산목/세목/예산과목 컬럼을 범주형(category)으로 변환합니다. (결측값은 유지)'''
+        converted = {}
+        for column in ('예산목', '세목', '예산과목'):
+            if column in data.columns and not isinstance(data[column].dtype, pd.CategoricalDtype):
+                values = data[column]
+                # 숫자 등이 섞여 있어도 문자열 범주로 통일
+                # (object로 먼저 바꿔 전체가 결측인 실수형 컬럼도 문자열 범주가 되어 .str 매칭이 동작하도록 함)
+                converted[column] = values.astype(object).where(values.isna(), values.astype(str)).astype('category')
+
+        return data.assign(**converted) if converted else data
+
     def _generate_total_summary(self, research_data: pd.DataFrame) -> pd.DataFrame:
         '''총합 표를 생성합니다.'''
         try:
@@ -1498,15 +1493,12 @@ class SummarySheetGenerator:
                 return pd.DataFrame(columns=SUMMARY_SHEET_COLUMNS)
 
             # 2. 총액 행을 찾아서 그 앞에 연구개발비와 유형자산 행 추가
-            total_row_idx = None
-            for idx, row in business_summary.iterrows():
-                if row['예산목'] == '총액':
-                    total_row_idx = idx
-                    break
+            total_row_labels = business_summary.index[business_summary['예산목'] == '총액']
+            total_row_idx = total_row_labels[0] if len(total_row_labels) > 0 else None
 
             if total_row_idx is not None:
                 # 총액 행을 제거하고 새로운 행들을 추가
-                result_data = business_summary.iloc[:total_row_idx].copy()
+                result_data = business_summary.iloc[:total_row_idx]
 
                 # 연구개발비와 유형자산의 실제 지출액 계산
                 research_dev_expense = self._calculate_research_expense(research_data, '연구개발비')
@@ -1534,15 +1526,13 @@ class SummarySheetGenerator:
                     '집행률': '0%' if asset_expense == 0 else '∞%'
                 }
 
-                # 새로운 행들을 DataFrame에 추가
-                result_data = pd.concat([
-                    result_data,
-                    pd.DataFrame([research_dev_row]),
-                    pd.DataFrame([asset_row])
-                ], ignore_index=True)
+                # 새로운 행들을 레코드 목록에 추가 (DataFrame은 마지막에 한 번만 생성)
+                records = result_data.to_dict('records')
+                records.append(research_dev_row)
+                records.append(asset_row)
 
                 # 총액 행 다시 계산하여 추가
-                total_expense = (result_data['지출액'].sum() if len(result_data) > 0 else 0)
+                total_expense = result_data['지출액'].sum() + research_dev_expense + asset_expense
                 total_row = {
                     '예산목': '총액',
                     '세목': '',
@@ -1552,10 +1542,10 @@ class SummarySheetGenerator:
                     '예산잔액': -total_expense,
                     '집행률': '0%' if total_expense == 0 else '∞%'
                 }
-                result_data = pd.concat([result_data, pd.DataFrame([total_row])], ignore_index=True)
+                records.append(total_row)
 
             else:
-                result_data = business_summary.copy()
+                records = business_summary.to_dict('records')
 
             # 총합 표 제목 추가
             title_row = {
@@ -1567,16 +1557,12 @@ class SummarySheetGenerator:
                 '예산잔액': '',
                 '집행률': ''
             }
-            result_data = pd.concat([pd.DataFrame([title_row]), result_data], ignore_index=True)
 
             # 총합 표 뒤에 2개 빈 행 추가
-            empty_rows = []
-            for _ in range(2):
-                empty_row = {col: '' for col in SUMMARY_SHEET_COLUMNS}
-                empty_rows.append(empty_row)
-            result_data = pd.concat([result_data, pd.DataFrame(empty_rows)], ignore_index=True)
+            empty_row = {col: '' for col in SUMMARY_SHEET_COLUMNS}
 
-            return result_data
+            records = [title_row] + records + [empty_row] * 2
+            return pd.DataFrame.from_records(records, columns=SUMMARY_SHEET_COLUMNS)
 
         except Exception as e:
             logging.error(f"총합 표 생성 중 오류: {str(e)}")
@@ -1587,73 +1573,53 @@ class SummarySheetGenerator:
         try:
             individual_summaries = []
 
-            # 연구주제와 연구자 조합 추출
-            topic_researcher_combinations = self._extract_topic_researcher_combinations(research_data)
-            logging.info(f"추출된 연구주제/연구자 조합: {topic_researcher_combinations}")
+            if '적요' not in research_data.columns:
+                logging.error("적요 컬럼이 연구비 데이터에 없습니다.")
+                return individual_summaries
 
-            for topic, researcher in topic_researcher_combinations:
-                logging.info(f"개별 표 생성 중: {topic} - {researcher}")
-
-                # 해당 주제/연구자의 데이터만 필터링
-                filtered_data = self._filter_data_by_topic_researcher(research_data, topic, researcher)
-                logging.info(f"필터링된 데이터 건수: {len(filtered_data)}")
-
-                if not filtered_data.empty:
-                    # 개별 표 생성 (총액 행 없음)
-                    individual_table = self._generate_individual_table(filtered_data, topic, researcher)
-                    individual_summaries.append(individual_table)
-                    logging.info(f"개별 표 생성 완료: {topic} - {researcher}")
-                else:
-                    logging.warning(f"필터링된 데이터가 비어있음: {topic} - {researcher}")
-
-            logging.info(f"총 {len(individual_summaries)}개의 개별 표 생성됨")
-            return individual_summaries
-
-        except Exception as e:
-            logging.error(f"개별 표 생성 중 오류: {str(e)}")
-            return []
+            logging.info(f"적요 컬럼에서 연구주제/연구자 조합 추출 시작 (총 {len(research_data)}건)")
 
-    def _extract_topic_researcher_combinations(self, research_data: pd.DataFrame) -> list:
-        '''연구주제와 연구자 조합을 추출합니다.'''
-        combinations = set()
+            # 적요에서 연구주제/연구자를 한 번만 추출하여 재사용
+            research_data = self._assign_topic_researcher_columns(research_data)
 
-        if '적요' in research_data.columns:
-            logging.info(f"적요 컬럼에서 연구주제/연구자 조합 추출 시작 (총 {len(research_data)}건)")
+            # 처음 5개만 로그 출력 (디버그 레벨일 때만)
+            if logger.isEnabledFor(logging.DEBUG):
+                for summary, topic, researcher in research_data[['적요', '_topic', '_researcher']].head(5).itertuples(index=False):
+                    logger.debug("적요: %s", summary)
+                    logger.debug("추출된 주제: '%s', 연구자: '%s'", topic, researcher)
 
-            for idx, row in research_data.iterrows():
-                summary = row['적요']
-                topic = self._extract_research_topic(summary)
-                researcher = self._extract_researcher_name(summary)
+            # 연구주제/연구자 조합별로 한 번에 분할 (정렬된 조합 순서로 순회)
+            grouped = research_data.groupby(['_topic', '_researcher'], sort=True)
 
-                if idx < 5:  # 처음 5개만 로그 출력
-                    logging.info(f"적요: {summary}")
-                    logging.info(f"추출된 주제: '{topic}', 연구자: '{researcher}'")
+            for (topic, researcher), filtered_data in grouped:
+                if not topic or not researcher:
+                    continue
 
-                if topic and researcher:
-                    combinations.add((topic, researcher))
-                    logging.info(f"조합 추가: ({topic}, {researcher})")
-        else:
-            logging.error("적요 컬럼이 연구비 데이터에 없습니다.")
+                logger.debug("개별 표 생성 중: %s - %s", topic, researcher)
 
-        result = sorted(list(combinations))
-        logging.info(f"최종 추출된 조합: {result}")
-        return result
+                # 보조 컬럼은 개별 표 생성에 필요하지 않으므로 제거
+                filtered_data = filtered_data.drop(columns=['_topic', '_researcher'])
+                logger.debug("필터링된 데이터 건수: %d", len(filtered_data))
 
-    def _filter_data_by_topic_researcher(self, research_data: pd.DataFrame, topic: str, researcher: str) -> pd.DataFrame:
-        '''특정 연구주제와 연구자의 데이터만 필터링합니다.'''
-        if '적요' not in research_data.columns:
-            return pd.DataFrame()
+                # 개별 표 생성 (총액 행 없음)
+                individual_table = self._generate_individual_table(filtered_data, topic, researcher)
+                individual_summaries.append(individual_table)
+                logger.debug("개별 표 생성 완료: %s - %s", topic, researcher)
 
-        filtered_rows = []
-        for _, row in research_data.iterrows():
-            summary = row['적요']
-            row_topic = self._extract_research_topic(summary)
-            row_researcher = self._extract_researcher_name(summary)
+            logging.info(f"총 {len(individual_summaries)}개의 개별 표 생성됨")
+            return individual_summaries
 
-            if row_topic == topic and row_researcher == researcher:
-                filtered_rows.append(row)
+        except Exception as e:
+            logging.error(f"개별 표 생성 중 오류: {str(e)}")
+            return []
 
-        return pd.DataFrame(filtered_rows) if filtered_rows else pd.DataFrame()
+    def _assign_topic_researcher_columns(self, research_data: pd.DataFrame) -> pd.DataFrame:
+        '''적요에서 추출한 연구주제/연구자를 _topic, _researcher 보조 컬럼으로 추가합니다.'''
+        summaries = research_data['적요']
+        return research_data.assign(
+            _topic=_extract_summary_field(summaries, TOPIC_RE),
+            _researcher=_extract_summary_field(summaries, RESEARCHER_RE)
+        )
 
     def _generate_individual_table(self, filtered_data: pd.DataFrame, topic: str, researcher: str) -> pd.DataFrame:
         '''개별 연구주제/연구자 표를 생성합니다.'''
@@ -1666,114 +1632,110 @@ class SummarySheetGenerator:
                 base_summary = self._create_empty_budget_structure()
 
             # 총액 행 제거
-            result_data = base_summary[base_summary['예산목'] != '총액'].copy()
+            result_data = base_summary[base_summary['예산목'] != '총액']
 
-            # 연구개발비와 유형자산 행 추가
+            # 연구개발비와 유형자산 지출액
             research_dev_expense = self._calculate_research_expense(filtered_data, '연구개발비')
             asset_expense = self._calculate_research_expense(filtered_data, '자산취득비')
 
-            research_dev_row = {
-                '예산목': '연구개발비',
-                '세목': '연구개발비',
-                '예산과목': '연구개발비',
-                '예산금액': 0,
-                '지출액': research_dev_expense,
-                '예산잔액': -research_dev_expense,
-                '집행률': '0%' if research_dev_expense == 0 else '∞%'
-            }
+            return self._build_individual_table(result_data, research_dev_expense, asset_expense, topic, researcher)
 
-            asset_row = {
-                '예산목': '유형자산',
-                '세목': '자산취득비',
-                '예산과목': '자산취득비',
-                '예산금액': 0,
-                '지출액': asset_expense,
-                '예산잔액': -asset_expense,
-                '집행률': '0%' if asset_expense == 0 else '∞%'
-            }
+        except Exception as e:
+            logging.error(f"개별 표 생성 중 오류: {str(e)}")
+            return pd.DataFrame(columns=SUMMARY_SHEET_COLUMNS)
 
-            result_data = pd.concat([
-                result_data,
-                pd.DataFrame([research_dev_row]),
-                pd.DataFrame([asset_row])
-            ], ignore_index=True)
+    def _build_individual_table(self, budget_rows: pd.DataFrame, research_dev_expense: float,
+                                asset_expense: float, topic: str, researcher: str) -> pd.DataFrame:
+        '''예산과목 행에 제목/연구개발비/유형자산/구분용 빈 행을 붙여 개별 표를 만듭니다.'''
+        research_dev_row = {
+            '예산목': '연구개발비',
+            '세목': '연구개발비',
+            '예산과목': '연구개발비',
+            '예산금액': 0,
+            '지출액': research_dev_expense,
+            '예산잔액': -research_dev_expense,
+            '집행률': '0%' if research_dev_expense == 0 else '∞%'
+        }
 
-            # 제목 행 추가 (주제와 연구자)
-            title_row = {
-                '예산목': topic,
-                '세목': researcher,
-                '예산과목': '',
-                '예산금액': '',
-                '지출액': '',
-                '예산잔액': '',
-                '집행률': ''
-            }
+        asset_row = {
+            '예산목': '유형자산',
+            '세목': '자산취득비',
+            '예산과목': '자산취득비',
+            '예산금액': 0,
+            '지출액': asset_expense,
+            '예산잔액': -asset_expense,
+            '집행률': '0%' if asset_expense == 0 else '∞%'
+        }
 
-            # 빈 행들 추가 (구분을 위해 2개)
-            empty_rows = []
-            for _ in range(2):
-                empty_row = {col: '' for col in SUMMARY_SHEET_COLUMNS}
-                empty_rows.append(empty_row)
+        # 제목 행 (주제와 연구자)
+        title_row = {
+            '예산목': topic,
+            '세목': researcher,
+            '예산과목': '',
+            '예산금액': '',
+            '지출액': '',
+            '예산잔액': '',
+            '집행률': ''
+        }
 
-            result_data = pd.concat([
-                pd.DataFrame(empty_rows),
-                pd.DataFrame([title_row]),
-                result_data
-            ], ignore_index=True)
+        # 구분용 빈 행 (표 앞뒤로 2개씩)
+        empty_row = {col: '' for col in SUMMARY_SHEET_COLUMNS}
 
-            # 개별 표 뒤에도 2개의 빈 행 추가 (다음 표와의 구분용)
-            end_empty_rows = []
-            for _ in range(2):
-                empty_row = {col: '' for col in SUMMARY_SHEET_COLUMNS}
-                end_empty_rows.append(empty_row)
+        # 모든 행을 한 번에 모아 DataFrame을 한 번만 생성
+        rows = (
+            [empty_row] * 2
+            + [title_row]
+            + budget_rows.to_dict('records')
+            + [research_dev_row, asset_row]
+            + [empty_row] * 2
+        )
+        return pd.DataFrame.from_records(rows, columns=SUMMARY_SHEET_COLUMNS)
 
-            result_data = pd.concat([result_data, pd.DataFrame(end_empty_rows)], ignore_index=True)
+    def _create_empty_budget_structure(self) -> pd.DataFrame:
+        '''빈 예산 구조를 생성합니다. (예산 분류 기준으로 한 번만 만들고 복사본 반환)'''
+        try:
+            if self._empty_budget_structure is None:
+                self._empty_budget_structure = self._build_empty_budget_structure()
 
-            return result_data
+            return self._empty_budget_structure.copy()
 
         except Exception as e:
-            logging.error(f"개별 표 생성 중 오류: {str(e)}")
+            logging.error(f"빈 예산 구조 생성 중 오류: {str(e)}")
             return pd.DataFrame(columns=SUMMARY_SHEET_COLUMNS)
 
-    def _create_empty_budget_structure(self) -> pd.DataFrame:
-        '''빈 예산 구조를 생성합니다.'''
-        try:
-            # 기본 구조 생성
-            hierarchical_data = self._create_hierarchical_structure(pd.DataFrame())
+    def _build_empty_budget_structure(self) -> pd.DataFrame:
+        '''예산 분류로부터 빈 예산 구조를 만듭니다.'''
+        # 기본 구조 생성
+        hierarchical_data = self._create_hierarchical_structure(pd.DataFrame())
 
-            if hierarchical_data.empty:
-                # 수동으로 기본 구조 생성
-                budget_categories = self.budget_classification['budget_categories']
-                rows = []
-
-                for budget_category, category_info in budget_categories.items():
-                    is_first_category = True
-                    for subcategory, budget_items in category_info['subcategories'].items():
-                        is_first_subcategory = True
-                        for budget_item in budget_items:
-                            row = {
-                                '예산목': budget_category if is_first_category else '',
-                                '세목': subcategory if is_first_subcategory else '',
-                                '예산과목': budget_item,
-                                '예산금액': 0,
-                                '지출액': 0,
-                                '예산잔액': 0,
-                                '집행률': '0%'
-                            }
-                            rows.append(row)
-                            is_first_category = False
-                            is_first_subcategory = False
-
-                hierarchical_data = pd.DataFrame(rows)
+        if hierarchical_data.empty:
+            # 수동으로 기본 구조 생성
+            # 예산목/세목은 각 그룹의 첫 행에만 표시
+            budget_categories = self.budget_classification['budget_categories']
+            rows = [
+                {
+                    '예산목': budget_category if i == 0 and j == 0 else '',
+                    '세목': subcategory if j == 0 else '',
+                    '예산과목': budget_item,
+                    '예산금액': 0,
+                    '지출액': 0,
+                    '예산잔액': 0,
+                    '집행률': '0%'
+                }
+                for budget_category, category_info in budget_categories.items()
+                for i, (subcategory, budget_items) in enumerate(category_info['subcategories'].items())
+                for j, budget_item in enumerate(budget_items)
+            ]
 
-            return hierarchical_data
+            hierarchical_data = pd.DataFrame.from_records(rows)
 
-        except Exception as e:
-            logging.error(f"빈 예산 구조 생성 중 오류: {str(e)}")
-            return pd.DataFrame(columns=SUMMARY_SHEET_COLUMNS)
+        return hierarchical_data
 
     def _calculate_research_expense(self, research_data: pd.DataFrame, category: str) -> float:
-        '''연구비 데이터에서 특정 카테고리의 지출액을 계산합니다.'''
+        '''
+        연구비 데이터에서 특정 카테고리의 지출액을 계산합니다.
+        총지급액은 generate_research_summary_sheet에서 한 번 숫자로 변환된 컬럼을 그대로 사용합니다.
+        '''
         try:
             if research_data is None or research_data.empty:
                 return 0.0
@@ -1782,42 +1744,30 @@ class SummarySheetGenerator:
                 logging.warning("연구비 데이터에 '총지급액' 컬럼이 없습니다.")
                 return 0.0
 
-            # 카테고리별 키워드 매핑
-            category_keywords = {
-                '연구개발비': ['연구개발비', '연구비', '연구개발'],
-                '자산취득비': ['자산취득비', '자산취득', '유형자산', '장비구입', '기자재']
-            }
-
-            if category not in category_keywords:
+            pattern = self._research_expense_patterns.get(category)
+            if pattern is None:
                 return 0.0
 
-            keywords = category_keywords[category]
-            total_expense = 0.0
-
             # 예산과목이나 적요에서 키워드를 포함하는 항목들의 지출액 합계
-            for _, row in research_data.iterrows():
-                budget_item = str(row.get('예산과목', ''))
-                summary = str(row.get('적요', ''))
-                expense = pd.to_numeric(row.get('총지급액', 0), errors='coerce')
-
-                if pd.isna(expense):
-                    expense = 0.0
-
-                # 키워드 매칭 확인
-                for keyword in keywords:
-                    if keyword in budget_item or keyword in summary:
-                        total_expense += expense
-                        break  # 중복 계산 방지
-
-            return total_expense
+            mask = pd.Series(False, index=research_data.index)
+            for column in ('예산과목', '적요'):
+                if column in research_data.columns:
+                    values = research_data[column]
+                    if not isinstance(values.dtype, pd.CategoricalDtype):
+                        values = values.astype(str)
+                    # 범주형은 범주 단위로 한 번만 매칭됨
+                    mask |= values.str.contains(pattern, regex=True, na=False)
+
+            amounts = research_data['총지급액'].to_numpy()
+            return float(amounts[mask.to_numpy()].sum())
 
         except Exception as e:
             logging.error(f"연구비 지출액 계산 중 오류: {str(e)}")
             return 0.0
 
     def get_summary_data(self) -> Optional[pd.DataFrame]:
-        '''생성된 요약 데이터를 반환합니다.'''
-        return self.summary_data.copy() if self.summary_data is not None else None
+        '''생성된 요약 데이터를 반환합니다. (복사하지 않으므로 수정이 필요하면 호출 측에서 copy()하여 사용)'''
+        return self.summary_data
 
 
 class DashboardGenerator:
@@ -1841,6 +1791,33 @@ class DashboardGenerator:
             'purple_accent': '8B5CF6'      # 보라 액센트 (심층연구)
         }
 
+        # 반복 사용되는 스타일 객체 (한 번만 생성하여 모든 셀에서 재사용)
+        white = self.color_palette['white_text']
+        silver = self.color_palette['silver_accent']
+        gray = self.color_palette['translucent_gray']
+        black = self.color_palette['primary_black']
+        self._gray_fill = PatternFill(start_color=gray, end_color=gray, fill_type='solid')
+        self._black_fill = PatternFill(start_color=black, end_color=black, fill_type='solid')
+        self._shadow_fill = PatternFill(start_color='000000', end_color='000000', fill_type='solid')
+        self._center_alignment = Alignment(horizontal='center', vertical='center')
+        self._premium_border = Border(
+            left=Side(style='medium', color=silver),
+            right=Side(style='medium', color=silver),
+            top=Side(style='medium', color=silver),
+            bottom=Side(style='medium', color=silver)
+        )
+        self._dark_border = Border(
+            left=Side(style='thin', color='000000'),
+            right=Side(style='thin', color='000000'),
+            top=Side(style='thin', color='000000'),
+            bottom=Side(style='thin', color='000000')
+        )
+        self._cell_font = Font(name='맑은 고딕', size=10, color=white)
+        self._table_data_font = Font(name='맑은 고딕', size=11, color=white)
+        self._table_header_font = Font(name='맑은 고딕', size=12, bold=False, color=white)
+        self._section_title_font = Font(name='맑은 고딕', size=16, bold=True, color=silver)
+        self._data_label_font = Font(name='맑은 고딕', size=13)
+
     def generate_dashboard_sheet(self, total_sheet_data: pd.DataFrame) -> pd.DataFrame:
         '''
         총액 시트 데이터를 기반으로 대시보드 시트를 생성합니다.
@@ -1920,11 +1897,10 @@ class DashboardGenerator:
                 }
 
             # 총액 행 찾기 (DataFrame의 인덱스 + 2 = Excel 행 번호, 헤더 때문에)
+            total_row_labels = total_sheet_data.index[total_sheet_data['예산목'] == '총액']
             total_row_index = None
-            for idx, row in total_sheet_data.iterrows():
-                if row['예산목'] == '총액':
-                    total_row_index = idx + 2  # DataFrame 인덱스 + 헤더(1) + Excel 1-based(1)
-                    break
+            if len(total_row_labels) > 0:
+                total_row_index = total_row_labels[0] + 2  # DataFrame 인덱스 + 헤더(1) + Excel 1-based(1)
 
             if total_row_index is None:
                 # 총액 행이 없으면 마지막 행 + 1로 설정 (총액 행이 추가될 위치)
@@ -1959,15 +1935,20 @@ class DashboardGenerator:
             logging.info("검정색 배경 대시보드 레이아웃 설정 시작")
 
             # 컬럼 너비 설정 (더 넓게)
-            worksheet.column_dimensions['A'].width = 3   # 여백
-            worksheet.column_dimensions['B'].width = 25  # 라벨 (KPI 카드와 통일)
-            worksheet.column_dimensions['C'].width = 20  # 값
-            worksheet.column_dimensions['D'].width = 25  # KPI 카드와 통일
-            worksheet.column_dimensions['E'].width = 25  # 차트 영역
-            worksheet.column_dimensions['F'].width = 25  # 차트 영역 (KPI 카드와 통일)
-            worksheet.column_dimensions['G'].width = 25  # 차트 영역
-            worksheet.column_dimensions['H'].width = 25  # KPI 카드와 통일
-            worksheet.column_dimensions['J'].width = 25  # KPI 카드와 통일
+            column_widths = {
+                'A': 3,   # 여백
+                'B': 25,  # 라벨 (KPI 카드와 통일)
+                'C': 20,  # 값
+                'D': 25,  # KPI 카드와 통일
+                'E': 25,  # 차트 영역
+                'F': 25,  # 차트 영역 (KPI 카드와 통일)
+                'G': 25,  # 차트 영역
+                'H': 25,  # KPI 카드와 통일
+                'J': 25,  # KPI 카드와 통일
+            }
+            column_dimensions = worksheet.column_dimensions
+            for col, width in column_widths.items():
+                column_dimensions[col].width = width
 
             # 행 높이 설정 (더 높게)
             for row in range(1, 35):
@@ -1981,8 +1962,6 @@ class DashboardGenerator:
     def _create_dark_dashboard_header(self, worksheet):
         '''검정색 배경의 대시보드 헤더를 생성합니다.'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill
-
             # 메인 제목 (흰색 텍스트)
             worksheet['B2'] = "2025 차세대 국가대표 스포츠과학지원 사업 예산 현황"
             worksheet['B2'].font = Font(name='맑은 고딕', size=28, bold=True, color='FFFFFF')  # 흰색
@@ -2005,30 +1984,22 @@ class DashboardGenerator:
     def _setup_modern_dashboard_layout(self, worksheet):
         '''현대적 High-end Company 스타일의 대시보드 레이아웃을 설정합니다.'''
         try:
-            from openpyxl.styles import PatternFill
-
-            # 메인 검정색 배경
-            black_fill = PatternFill(start_color=self.color_palette['primary_black'],
-                                   end_color=self.color_palette['primary_black'], fill_type='solid')
-
-            # 전체 워크시트 배경을 검정색으로 설정 (V열까지 확장)
-            for row in range(1, 60):
-                for col in range(1, 23):  # V열은 22번째 열이므로 23까지
-                    cell = worksheet.cell(row=row, column=col)
-                    cell.fill = black_fill
+            # 검정색 배경은 _apply_modern_dashboard_styling에서 채워지지 않은 셀에 한 번만 적용
+            # (여기서 셀 단위로 미리 칠하면 같은 영역을 두 번 순회하게 됨)
 
             # 고급스러운 컬럼 너비 설정 (V열까지 확장)
+            # B~J는 예산과목별 지표 표(7개 컬럼)와 KPI 카드가 함께 쓰는 최종 너비로 한 번만 설정
             column_widths = {
                 'A': 3,   # 여백
-                'B': 25,  # 메인 콘텐츠 (KPI 카드 폭 통일)
-                'C': 20,  # 여백
-                'D': 25,  # KPI 카드 (폭 확장)
-                'E': 20,  # 여백
-                'F': 25,  # KPI 카드 (폭 통일)
-                'G': 20,  # 여백
-                'H': 25,  # KPI 카드 (폭 통일)
+                'B': 20,  # 메인 콘텐츠 / 예산목
+                'C': 20,  # 세목
+                'D': 20,  # KPI 카드 / 예산과목
+                'E': 20,  # 예산금액
+                'F': 20,  # KPI 카드 / 지출액
+                'G': 20,  # 예산잔액
+                'H': 20,  # KPI 카드 / 집행률
                 'I': 20,  # 여백
-                'J': 25,  # KPI 카드 (폭 통일)
+                'J': 23,  # KPI 카드
                 'K': 18,  # 차트 영역
                 'L': 18,  # 차트 영역
                 'M': 18,  # 차트 영역
@@ -2083,11 +2054,14 @@ class DashboardGenerator:
     def _create_modern_dashboard_header(self, worksheet):
         '''현대적 High-end Company 스타일의 대시보드 헤더를 생성합니다.'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-
             # 메인 제목 (실버 텍스트 + 그림자 효과)
+            # 팔레트 색상은 메서드 시작 시 한 번만 조회
+            silver = self.color_palette['silver_accent']
+            white = self.color_palette['white_text']
+            light_gray = self.color_palette['light_gray']
+
             worksheet['B2'] = "2025 차세대 국가대표 스포츠과학지원 사업 예산 현황"
-            worksheet['B2'].font = Font(name='맑은 고딕', size=32, bold=True, color=self.color_palette['silver_accent'])
+            worksheet['B2'].font = Font(name='맑은 고딕', size=32, bold=True, color=silver)
             worksheet['B2'].alignment = Alignment(horizontal='left', vertical='center')
 
             # 메인 제목 셀 병합 (더 넓게)
@@ -2095,23 +2069,21 @@ class DashboardGenerator:
 
             # 부제목 (밝은 회색 텍스트 + 이탤릭)
             worksheet['B3'] = "실시간 예산 집행 현황 및 KPI 지표 | Executive Dashboard"
-            worksheet['B3'].font = Font(name='맑은 고딕', size=14, italic=True, color=self.color_palette['light_gray'])
+            worksheet['B3'].font = Font(name='맑은 고딕', size=14, italic=True, color=light_gray)
             worksheet['B3'].alignment = Alignment(horizontal='left', vertical='center')
 
             # 부제목 셀 병합
             worksheet.merge_cells('B3:H3')
 
             # 고급스러운 구분선 (그라데이션 효과를 위한 여러 셀)
-            silver_fill = PatternFill(start_color=self.color_palette['silver_accent'],
-                                    end_color=self.color_palette['silver_accent'], fill_type='solid')
-
-            # 구분선을 더 넓게 설정
-            for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']:
-                worksheet[f'{col}4'].fill = silver_fill
-                worksheet[f'{col}4'].border = Border(
-                    top=Side(style='thin', color=self.color_palette['white_text']),
-                    bottom=Side(style='thin', color=self.color_palette['white_text'])
-                )
+            silver_fill = PatternFill(start_color=silver, end_color=silver, fill_type='solid')
+
+            # 구분선을 더 넓게 설정 (병합 영역은 좌상단 셀 스타일만 표시되므로 B4에만 적용)
+            worksheet['B4'].fill = silver_fill
+            worksheet['B4'].border = Border(
+                top=Side(style='thin', color=white),
+                bottom=Side(style='thin', color=white)
+            )
 
             worksheet.merge_cells('B4:K4')
 
@@ -2119,7 +2091,7 @@ class DashboardGenerator:
             from datetime import datetime
             current_time = datetime.now().strftime("%Y-%m-%d")
             worksheet['B1'] = f"업데이트: {current_time}"
-            worksheet['B1'].font = Font(name='맑은 고딕', size=10, color=self.color_palette['light_gray'])
+            worksheet['B1'].font = Font(name='맑은 고딕', size=10, color=light_gray)
             worksheet['B1'].alignment = Alignment(horizontal='left', vertical='center')
 
         except Exception as e:
@@ -2128,80 +2100,53 @@ class DashboardGenerator:
     def _create_project_info_section(self, worksheet):
         '''사업 기본 정보 섹션을 생성합니다. (B5에 배치)'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
             from config import YEARLY_BUDGET_DATA
             
             # 사업 정보 배경 (반투명 회색)
-            info_fill = PatternFill(start_color=self.color_palette['translucent_gray'],
-                                  end_color=self.color_palette['translucent_gray'], fill_type='solid')
-            
-            # 고급스러운 테두리
-            info_border = Border(
-                left=Side(style='thin', color=self.color_palette['silver_accent']),
-                right=Side(style='thin', color=self.color_palette['silver_accent']),
-                top=Side(style='thin', color=self.color_palette['silver_accent']),
-                bottom=Side(style='thin', color=self.color_palette['silver_accent'])
-            )
+            info_fill = self._gray_fill
 
-            # 사업기간 정보 (B5:C5)
-            worksheet['B5'] = "사업기간"
-            worksheet['B5'].font = Font(name='맑은 고딕', size=11, bold=True, color=self.color_palette['white_text'])
-            worksheet['B5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['B5'].fill = info_fill
-            worksheet['B5'].border = info_border
-
-            worksheet['C5'] = "2025.03.01 ~ 2026.02.28"
-            worksheet['C5'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['info_blue'])
-            worksheet['C5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['C5'].fill = info_fill
-            worksheet['C5'].border = info_border
-
-            # 총예산 정보 (D5:E5)
-            worksheet['D5'] = "총예산"
-            worksheet['D5'].font = Font(name='맑은 고딕', size=11, bold=True, color=self.color_palette['white_text'])
-            worksheet['D5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['D5'].fill = info_fill
-            worksheet['D5'].border = info_border
+            palette = self.color_palette
+
+            # 고급스러운 테두리
+            silver_side = Side(style='thin', color=palette['silver_accent'])
+            info_border = Border(left=silver_side, right=silver_side, top=silver_side, bottom=silver_side)
 
             # 2025년 총예산 계산 (예산과목: 금액 딕셔너리의 합)
             total_budget = sum(YEARLY_BUDGET_DATA['2025'].values())
-            worksheet['E5'] = f'=TEXT({total_budget},"#,##0")'
-            worksheet['E5'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['success_green'])
-            worksheet['E5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['E5'].fill = info_fill
-            worksheet['E5'].border = info_border
-
-            # 사업진행률 정보 (F5:G5)
-            worksheet['F5'] = "사업진행률"
-            worksheet['F5'].font = Font(name='맑은 고딕', size=11, bold=True, color=self.color_palette['white_text'])
-            worksheet['F5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['F5'].fill = info_fill
-            worksheet['F5'].border = info_border
 
             # 사업진행률 계산 (현재 날짜 기준)
             from datetime import datetime, date
             start_date = date(2025, 3, 1)
             end_date = date(2026, 2, 28)
             current_date = datetime.now().date()
-            # print(f"Current date: {current_date}, Start date: {start_date}, End date: {end_date}")
-            
+
             if current_date < start_date:
                 progress_rate = 0
             elif current_date > end_date:
                 progress_rate = 100
             else:
                 total_days = (end_date - start_date).days
-                # print(f"Total days in project: {total_days}")
                 elapsed_days = (current_date - start_date).days
-                # print(f"Elapsed days since start: {elapsed_days}")
                 progress_rate = (elapsed_days / total_days) * 100
-                # print(f"Calculated progress rate: {progress_rate:.2f}%")
 
-            worksheet['G5'] = f'"{progress_rate:.1f}%"'
-            worksheet['G5'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['warning_orange'])
-            worksheet['G5'].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet['G5'].fill = info_fill
-            worksheet['G5'].border = info_border
+            # 항목명(굵은 흰색) / 값(항목별 강조색) 폰트
+            label_font = Font(name='맑은 고딕', size=11, bold=True, color=palette['white_text'])
+            info_cells = [
+                ("사업기간", label_font),  # B5:C5
+                ("2025.03.01 ~ 2026.02.28", Font(name='맑은 고딕', size=11, color=palette['info_blue'])),
+                ("총예산", label_font),  # D5:E5
+                (f'=TEXT({total_budget},"#,##0")', Font(name='맑은 고딕', size=11, color=palette['success_green'])),
+                ("사업진행률", label_font),  # F5:G5
+                (f'"{progress_rate:.1f}%"', Font(name='맑은 고딕', size=11, color=palette['warning_orange']))
+            ]
+
+            # B5~G5에 값과 스타일을 한 번에 기록
+            for col_idx, (value, font) in enumerate(info_cells, start=2):
+                cell = worksheet.cell(row=5, column=col_idx, value=value)
+                cell.font = font
+                cell.alignment = self._center_alignment
+                cell.fill = info_fill
+                cell.border = info_border
 
             logging.info("사업 기본 정보 섹션 생성 완료")
 
@@ -2211,13 +2156,17 @@ class DashboardGenerator:
     def _create_modern_kpi_section(self, worksheet, excel_refs: dict):
         '''현대적 스타일의 KPI 지표 섹션을 생성합니다. (총액 시트 참조)'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-
             logging.info("현대적 KPI 섹션 생성 시작 - 총액 시트 참조")
 
             # KPI 섹션 제목 (실버 텍스트) - 레이아웃에 맞춰 B6에 배치
+            # 카드별 강조색은 팔레트에서 한 번만 조회
+            green = self.color_palette['success_green']
+            blue = self.color_palette['info_blue']
+            orange = self.color_palette['warning_orange']
+            silver = self.color_palette['silver_accent']
+
             worksheet['B6'] = "핵심 성과 지표 (KPI)"
-            worksheet['B6'].font = Font(name='맑은 고딕', size=18, bold=True, color=self.color_palette['silver_accent'])
+            worksheet['B6'].font = Font(name='맑은 고딕', size=18, bold=True, color=silver)
 
             # KPI 카드 스타일 설정 (화이트 테두리)
             card_border = Border(
@@ -2236,44 +2185,44 @@ class DashboardGenerator:
                 self._create_modern_kpi_card_with_formula(
                     worksheet, 'B8', '총액 집행률',
                     f'=ROUND((총액!{excel_refs["center_col"]}{total_row}+총액!{excel_refs["research_col"]}{total_row})/총액!{excel_refs["budget_col"]}{total_row}*100,1)&"%"',
-                    self.color_palette['success_green'], card_border
+                    green, card_border
                 )
 
                 # 인건비제외 집행률 카드 (인건비 항목 제외한 집행률)
                 self._create_modern_kpi_card_with_formula(
                     worksheet, 'D8', '인건비제외 집행률',
                     f'=IFERROR(ROUND(((총액!{excel_refs["center_col"]}{excel_refs["total_row_index"]}+총액!{excel_refs["research_col"]}{excel_refs["total_row_index"]})-(총액!E2+총액!F2+총액!E3+총액!F3))/(총액!{excel_refs["budget_col"]}{excel_refs["total_row_index"]}-총액!D2-총액!D3)*100,1)&"%","0%")',  # 인건비를 제외한 집행률 계산 (인건비 예산 및 집행액 제외)
-                    self.color_palette['info_blue'], card_border
+                    blue, card_border
                 )
 
                 # 센터 집행률 카드 (총액 시트 참조)
                 self._create_modern_kpi_card_with_formula(
                     worksheet, 'F8', '센터 집행률',
                     f'=ROUND(총액!{excel_refs["center_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)&"%"',
-                    self.color_palette['info_blue'], card_border
+                    blue, card_border
                 )
 
                 # 심층연구 집행률 카드 (총액 시트 참조)
                 self._create_modern_kpi_card_with_formula(
                     worksheet, 'H8', '심층연구 집행률',
                     f'=ROUND(총액!{excel_refs["research_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)&"%"',
-                    self.color_palette['warning_orange'], card_border
+                    orange, card_border
                 )
 
                 # 예산 잔액 카드 (총액 시트 참조) - 천 단위 구분자 적용
                 self._create_modern_kpi_card_with_formula(
                     worksheet, 'J8', '예산 잔액',
                     f'=TEXT(총액!{excel_refs["remaining_col"]}{total_row},"#,##0")',
-                    self.color_palette['silver_accent'], card_border
+                    silver, card_border
                 )
 
             else:
                 # 총액 시트 참조가 없는 경우 기본값 (동일한 행 배치 규칙 적용)
-                self._create_modern_kpi_card_with_formula(worksheet, 'B8', '총액 집행률', '0%', self.color_palette['success_green'], card_border)
-                self._create_modern_kpi_card_with_formula(worksheet, 'D8', '인건비제외 집행률', '0%', self.color_palette['info_blue'], card_border)
-                self._create_modern_kpi_card_with_formula(worksheet, 'F8', '센터 집행률', '0%', self.color_palette['info_blue'], card_border)
-                self._create_modern_kpi_card_with_formula(worksheet, 'H8', '심층연구 집행률', '0%', self.color_palette['warning_orange'], card_border)
-                self._create_modern_kpi_card_with_formula(worksheet, 'J8', '예산 잔액', '"0"', self.color_palette['silver_accent'], card_border)
+                self._create_modern_kpi_card_with_formula(worksheet, 'B8', '총액 집행률', '0%', green, card_border)
+                self._create_modern_kpi_card_with_formula(worksheet, 'D8', '인건비제외 집행률', '0%', blue, card_border)
+                self._create_modern_kpi_card_with_formula(worksheet, 'F8', '센터 집행률', '0%', blue, card_border)
+                self._create_modern_kpi_card_with_formula(worksheet, 'H8', '심층연구 집행률', '0%', orange, card_border)
+                self._create_modern_kpi_card_with_formula(worksheet, 'J8', '예산 잔액', '"0"', silver, card_border)
 
         except Exception as e:
             logging.error(f"KPI 섹션 생성 중 오류: {str(e)}")
@@ -2283,43 +2232,31 @@ class DashboardGenerator:
     def _create_modern_kpi_card_with_formula(self, worksheet, start_cell: str, title: str, formula: str, color: str, border):
         '''현대적 High-end Company 스타일의 개별 KPI 카드를 생성합니다. (Excel 수식 사용)'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-
-            # 고급스러운 카드 배경 (반투명 회색으로 고급스러움 추가)
-            card_fill = PatternFill(start_color=self.color_palette['translucent_gray'],
-                                  end_color=self.color_palette['translucent_gray'], fill_type='solid')
-
-            # 고급스러운 테두리 (더 두껍고 세련된)
-            premium_border = Border(
-                left=Side(style='medium', color=self.color_palette['silver_accent']),
-                right=Side(style='medium', color=self.color_palette['silver_accent']),
-                top=Side(style='medium', color=self.color_palette['silver_accent']),
-                bottom=Side(style='medium', color=self.color_palette['silver_accent'])
-            )
+            # 고급스러운 카드 배경 (반투명 회색) / 테두리 (더 두껍고 세련된)
+            card_fill = self._gray_fill
+            premium_border = self._premium_border
 
             # 제목 셀 (화이트 텍스트 + 더 큰 폰트)
-            worksheet[start_cell] = title
-            worksheet[start_cell].font = Font(name='맑은 고딕', size=13, bold=True, color=self.color_palette['white_text'])
-            worksheet[start_cell].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet[start_cell].fill = card_fill
-            worksheet[start_cell].border = premium_border
+            title_cell = worksheet[start_cell]
+            title_cell.value = title
+            title_cell.font = Font(name='맑은 고딕', size=13, bold=True, color=self.color_palette['white_text'])
+            title_cell.alignment = Alignment(horizontal='center', vertical='center')
+            title_cell.fill = card_fill
+            title_cell.border = premium_border
 
             # 값 셀 (아래 행, 컬러 텍스트 + Excel 수식 + 더 큰 폰트)
-            row = int(start_cell[1:]) + 1
-            col = start_cell[0]
-            value_cell = f"{col}{row}"
+            row = title_cell.row + 1
+            col = title_cell.column
 
-            worksheet[value_cell] = formula  # Excel 수식 입력
-            worksheet[value_cell].font = Font(name='맑은 고딕', size=18, bold=True, color=color)
-            worksheet[value_cell].alignment = Alignment(horizontal='center', vertical='center')
-            worksheet[value_cell].fill = card_fill
-            worksheet[value_cell].border = premium_border
+            value_cell = worksheet.cell(row=row, column=col, value=formula)  # Excel 수식 입력
+            value_cell.font = Font(name='맑은 고딕', size=18, bold=True, color=color)
+            value_cell.alignment = Alignment(horizontal='center', vertical='center')
+            value_cell.fill = card_fill
+            value_cell.border = premium_border
 
             # 카드 하단에 미세한 그림자 효과 (다음 행에 어두운 선)
             shadow_row = row + 1
-            shadow_cell = f"{col}{shadow_row}"
-            shadow_fill = PatternFill(start_color='000000', end_color='000000', fill_type='solid')
-            worksheet[shadow_cell].fill = shadow_fill
+            worksheet.cell(row=shadow_row, column=col).fill = self._shadow_fill
             worksheet.row_dimensions[shadow_row].height = 3  # 얇은 그림자
 
             logging.info(f"고급 KPI 카드 생성 완료: {title} - {formula}")
@@ -2330,8 +2267,6 @@ class DashboardGenerator:
     def _create_modern_chart_section(self, worksheet, excel_refs: dict):
         '''현대적 스타일의 차트 섹션을 생성합니다. (총액 시트 참조)'''
         try:
-            from openpyxl.styles import Font
-
             logging.info("현대적 차트 섹션 생성 시작 - 총액 시트 참조")
 
             # 차트 섹션 제목 (확장 KPI 아래 시작)
@@ -2340,14 +2275,14 @@ class DashboardGenerator:
 
             # 집행률 소제목 (차트 섹션 하위)
             worksheet['B13'] = "집행률"
-            worksheet['B13'].font = Font(name='맑은 고딕', size=16, bold=True, color=self.color_palette['silver_accent'])
+            worksheet['B13'].font = self._section_title_font
 
             # 집행률 비교 차트 생성 (총액 시트 참조) - 차트는 14행부터 시작하도록 조정
             self._create_modern_execution_rate_chart(worksheet, excel_refs)
 
             # 예산 배분 섹션 제목 추가 (차트 섹션 하위)
             worksheet['B19'] = "예산 배분"
-            worksheet['B19'].font = Font(name='맑은 고딕', size=16, bold=True, color=self.color_palette['silver_accent'])
+            worksheet['B19'].font = self._section_title_font
 
             # 예산 vs 집행 현황 차트 생성 (총액 시트 참조)
             self._create_modern_budget_vs_execution_chart(worksheet, excel_refs)
@@ -2358,54 +2293,53 @@ class DashboardGenerator:
     def _create_budget_item_indicators_section(self, worksheet, total_sheet_data: pd.DataFrame):
         '''대시보드에 예산과목별 지표 섹션을 생성합니다. (B25에 추가)'''
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-
             logging.info("대시보드 예산과목별 지표 섹션 생성 시작")
 
-            # 검정색 테두리 스타일 정의
-            dark_border = Border(
-                left=Side(style='thin', color='000000'),    # 검정색
-                right=Side(style='thin', color='000000'),
-                top=Side(style='thin', color='000000'),
-                bottom=Side(style='thin', color='000000')
-            )
+            # 검정색 테두리 / 데이터 셀 폰트 / 가운데 정렬 (공유 스타일 객체)
+            dark_border = self._dark_border
+            cell_font = self._cell_font
+            center_alignment = self._center_alignment
 
             # B25에 섹션 제목 추가 (대시보드 스타일에 맞춰) - 위치 조정
             worksheet['B25'] = "예산과목별 지표"
-            worksheet['B25'].font = Font(name='맑은 고딕', size=16, bold=True, color=self.color_palette['silver_accent'])
+            worksheet['B25'].font = self._section_title_font
             worksheet['B25'].alignment = Alignment(horizontal='left', vertical='center')
 
             # 차트 섹션과 동일한 스타일 적용 (반투명 회색 배경)
-            chart_fill = PatternFill(start_color=self.color_palette['translucent_gray'],
-                                   end_color=self.color_palette['translucent_gray'], fill_type='solid')
+            chart_fill = self._gray_fill
 
             # B26~H26에 헤더 추가 - 개선된 7개 컬럼 구조
             headers = ['예산목', '세목', '예산과목', '예산금액', '지출액', '예산잔액', '집행률(%)']
-            header_cells = ['B26', 'C26', 'D26', 'E26', 'F26', 'G26', 'H26']
+            ws_cell = worksheet.cell
 
-            for header, cell_ref in zip(headers, header_cells):
-                cell = worksheet[cell_ref]
-                cell.value = header
-                cell.font = Font(name='맑은 고딕', size=12, bold=False, color=self.color_palette['white_text'])
-                cell.alignment = Alignment(horizontal='center', vertical='center')  # 헤더 가운데 정렬
+            for col_idx, header in enumerate(headers, start=2):
+                cell = ws_cell(row=26, column=col_idx, value=header)
+                cell.font = self._table_header_font
+                cell.alignment = center_alignment  # 헤더 가운데 정렬
                 cell.border = dark_border  # 검정색 테두리 적용
                 # 헤더 배경은 차트 섹션과 동일한 반투명 회색으로 설정
                 cell.fill = chart_fill
 
             # 예산과목별 데이터 추출 (총액 행 제외) - 개선된 7개 컬럼 구조
-            budget_items_data = []
-            for _, row in total_sheet_data.iterrows():
-                if (row['예산과목'] and row['예산과목'] != '' and
-                    row['예산목'] != '총액' and not pd.isna(row['예산과목'])):
-                    budget_items_data.append({
-                        '예산목': row['예산목'],
-                        '세목': row['세목'],
-                        '예산과목': row['예산과목'],
-                        '예산금액': row['예산금액'],
-                        '지출액': row['센터'] + row['심층연구'],  # 센터 + 심층연구 = 지출액
-                        '예산잔액': row['예산잔액'],
-                        '집행률': row['집행률']
-                    })
+            budget_item_values = total_sheet_data['예산과목']
+            item_mask = (
+                budget_item_values.notna()
+                & (budget_item_values != '')
+                & (total_sheet_data['예산목'] != '총액')
+            )
+            item_rows = total_sheet_data.loc[item_mask]
+            budget_items_data = pd.DataFrame({
+                '예산목': item_rows['예산목'],
+                '세목': item_rows['세목'],
+                '예산과목': item_rows['예산과목'],
+                '예산금액': item_rows['예산금액'],
+                '지출액': item_rows['센터'] + item_rows['심층연구'],  # 센터 + 심층연구 = 지출액
+                '예산잔액': item_rows['예산잔액'],
+                '집행률': item_rows['집행률']
+            }).to_dict('records')
+
+            # 예산과목 → 총액 시트 행 번호 (한 번만 만들어 항목마다 O(1) 조회)
+            budget_item_rows = self._build_budget_item_row_index(total_sheet_data)
 
             # 데이터 행 추가 (B27부터 시작) - 개선된 7개 컬럼 구조
             start_row = 27
@@ -2418,97 +2352,61 @@ class DashboardGenerator:
                 row_num = start_row + i
 
                 # 예산목 (B열) - 중복 시 빈 값으로 설정 (병합 전 준비)
-                budget_category_cell = worksheet[f'B{row_num}']
+                budget_category_cell = ws_cell(row=row_num, column=2)
                 current_budget_category = item['예산목']
                 if current_budget_category != previous_budget_category:
                     budget_category_cell.value = current_budget_category
                     previous_budget_category = current_budget_category
                 else:
                     budget_category_cell.value = ""  # 중복된 경우 빈 값
-                budget_category_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                budget_category_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
+                budget_category_cell.font = cell_font
+                budget_category_cell.alignment = center_alignment  # 가운데 정렬
                 budget_category_cell.border = dark_border  # 검정색 테두리 적용
                 budget_category_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
 
                 # 세목 (C열) - 중복 시 빈 값으로 설정 (병합 전 준비)
-                subcategory_cell = worksheet[f'C{row_num}']
+                subcategory_cell = ws_cell(row=row_num, column=3)
                 current_subcategory = item['세목']
                 if current_subcategory != previous_subcategory:
                     subcategory_cell.value = current_subcategory
                     previous_subcategory = current_subcategory
                 else:
                     subcategory_cell.value = ""  # 중복된 경우 빈 값
-                subcategory_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                subcategory_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
+                subcategory_cell.font = cell_font
+                subcategory_cell.alignment = center_alignment  # 가운데 정렬
                 subcategory_cell.border = dark_border  # 검정색 테두리 적용
                 subcategory_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
 
                 # 예산과목 (D열)
-                budget_item_cell = worksheet[f'D{row_num}']
+                budget_item_cell = ws_cell(row=row_num, column=4)
                 budget_item_cell.value = item['예산과목']
-                budget_item_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                budget_item_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
+                budget_item_cell.font = cell_font
+                budget_item_cell.alignment = center_alignment  # 가운데 정렬
                 budget_item_cell.border = dark_border  # 검정색 테두리 적용
                 budget_item_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
 
-                # 예산금액 (E열) - 총액 시트 참조
-                budget_amount_cell = worksheet[f'E{row_num}']
-                original_row = self._find_budget_item_row_in_total_sheet(total_sheet_data, item['예산과목'])
-                if original_row:
-                    budget_amount_cell.value = f'=총액!D{original_row}'  # 총액 시트의 D열(예산금액) 참조
-                else:
-                    budget_amount_cell.value = item['예산금액']
-                budget_amount_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                budget_amount_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                budget_amount_cell.number_format = '#,##0'
-                budget_amount_cell.border = dark_border  # 검정색 테두리 적용
-                budget_amount_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
-
-                # 지출액 (F열) - 총액 시트의 센터+심층연구 참조
-                expense_cell = worksheet[f'F{row_num}']
-                if original_row:
-                    expense_cell.value = f'=총액!E{original_row}+총액!F{original_row}'  # 총액 시트의 E열(센터)+F열(심층연구) 참조
-                else:
-                    expense_cell.value = item['지출액']
-                expense_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                expense_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                expense_cell.number_format = '#,##0'
-                expense_cell.border = dark_border  # 검정색 테두리 적용
-                expense_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
-
-                # 예산잔액 (G열) - 총액 시트 참조
-                remaining_cell = worksheet[f'G{row_num}']
+                # 예산금액(E)/지출액(F)/예산잔액(G)/집행률(H) - 총액 시트에 행이 있으면 참조 수식, 없으면 계산값
+                original_row = budget_item_rows.get(item['예산과목'])
                 if original_row:
-                    remaining_cell.value = f'=총액!G{original_row}'  # 총액 시트의 G열(예산잔액) 참조
-                else:
-                    remaining_cell.value = item['예산잔액']
-                remaining_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                remaining_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                remaining_cell.number_format = '#,##0'
-                remaining_cell.border = dark_border  # 검정색 테두리 적용
-                remaining_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
-
-                # 집행률 (H열) - 총액 시트 참조
-                execution_cell = worksheet[f'H{row_num}']
-                if original_row:
-                    execution_cell.value = f'=총액!H{original_row}'  # 총액 시트의 H열(집행률) 참조
+                    amount_values = (
+                        f'=총액!D{original_row}',                       # 총액 시트의 D열(예산금액) 참조
+                        f'=총액!E{original_row}+총액!F{original_row}',  # 총액 시트의 E열(센터)+F열(심층연구) 참조
+                        f'=총액!G{original_row}',                       # 총액 시트의 G열(예산잔액) 참조
+                        f'=총액!H{original_row}'                        # 총액 시트의 H열(집행률) 참조
+                    )
                 else:
-                    execution_cell.value = f"{item['집행률']}"
-                execution_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                execution_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                execution_cell.border = dark_border  # 검정색 테두리 적용
-                execution_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
-
-            # 컬럼 너비 조정 (개선된 7개 컬럼 대시보드에 맞게)
-            worksheet.column_dimensions['B'].width = 20  # 예산목
-            worksheet.column_dimensions['C'].width = 20  # 세목
-            worksheet.column_dimensions['D'].width = 20  # 예산과목 (KPI 카드와 통일)
-            worksheet.column_dimensions['E'].width = 20  # 예산금액
-            worksheet.column_dimensions['F'].width = 20  # 지출액
-            worksheet.column_dimensions['G'].width = 20  # 예산잔액
-            worksheet.column_dimensions['H'].width = 20  # 집행률
-            worksheet.column_dimensions['I'].width = 20  # KPI 카드와 통일 (여백)
-            worksheet.column_dimensions['J'].width = 23  # KPI 카드와 통일
+                    amount_values = (item['예산금액'], item['지출액'], item['예산잔액'], f"{item['집행률']}")
+
+                for col_idx, value in enumerate(amount_values, start=5):
+                    amount_cell = ws_cell(row=row_num, column=col_idx, value=value)
+                    amount_cell.font = cell_font
+                    amount_cell.alignment = center_alignment  # 가운데 정렬
+                    if col_idx < 8:  # 금액 컬럼에만 천 단위 구분자
+                        amount_cell.number_format = '#,##0'
+                    amount_cell.border = dark_border  # 검정색 테두리 적용
+                    amount_cell.fill = chart_fill  # 차트 섹션과 동일한 배경
+
+            # 컬럼 너비는 _setup_modern_dashboard_layout에서 7개 컬럼 표에 맞게 설정됨
 
             # 예산목 컬럼 병합 처리 (중복 제거)
             self._merge_budget_category_cells(worksheet, budget_items_data, start_row, chart_fill)
@@ -2527,8 +2425,6 @@ class DashboardGenerator:
     def _merge_budget_category_cells(self, worksheet, budget_items_data: list, start_row: int, chart_fill):
         '''예산목 컬럼에서 중복되는 값들을 병합합니다.'''
         try:
-            from openpyxl.styles import Font, Alignment, Border, Side
-
             logging.info("예산목 컬럼 병합 처리 시작")
 
             # 어두운 회색 테두리 스타일 정의
@@ -2568,10 +2464,10 @@ class DashboardGenerator:
                     worksheet.merge_cells(merge_range)
                     
                     # 병합된 셀에 텍스트와 스타일 적용
-                    merged_cell = worksheet[f'B{start}']
+                    merged_cell = worksheet.cell(row=start, column=2)
                     merged_cell.value = budget_category
-                    merged_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                    merged_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
+                    merged_cell.font = self._cell_font
+                    merged_cell.alignment = self._center_alignment  # 가운데 정렬
                     merged_cell.border = dark_border  # 어두운 회색 테두리 적용
                     merged_cell.fill = chart_fill
 
@@ -2585,8 +2481,6 @@ class DashboardGenerator:
     def _merge_subcategory_cells(self, worksheet, budget_items_data: list, start_row: int, chart_fill):
         '''세목 컬럼에서 중복되는 값들을 병합합니다.'''
         try:
-            from openpyxl.styles import Font, Alignment, Border, Side
-
             logging.info("세목 컬럼 병합 처리 시작")
 
             # 어두운 회색 테두리 스타일 정의
@@ -2626,10 +2520,10 @@ class DashboardGenerator:
                     worksheet.merge_cells(merge_range)
                     
                     # 병합된 셀에 텍스트와 스타일 적용
-                    merged_cell = worksheet[f'C{start}']
+                    merged_cell = worksheet.cell(row=start, column=3)
                     merged_cell.value = subcategory
-                    merged_cell.font = Font(name='맑은 고딕', size=10, color=self.color_palette['white_text'])
-                    merged_cell.alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
+                    merged_cell.font = self._cell_font
+                    merged_cell.alignment = self._center_alignment  # 가운데 정렬
                     merged_cell.border = dark_border  # 어두운 회색 테두리 적용
                     merged_cell.fill = chart_fill
 
@@ -2643,8 +2537,6 @@ class DashboardGenerator:
     def _create_budget_item_charts(self, worksheet, data_count: int):
         '''예산과목별 지표 테이블 옆에 막대그래프를 생성합니다.'''
         try:
-            from openpyxl.chart import BarChart, Reference
-
             logging.info("예산과목별 지표 그래프 생성 시작")
 
             # 1. 예산잔액 막대그래프 (E22:I30)
@@ -2669,7 +2561,6 @@ class DashboardGenerator:
 
             # KPI와 동일한 색상 적용
             try:
-                from openpyxl.drawing.fill import SolidColorFillProperties
                 if len(budget_chart.series) > 0:
                     budget_chart.series[0].graphicalProperties.solidFill = SolidColorFillProperties(self.color_palette['primary_blue'])
             except Exception as color_e:
@@ -2677,15 +2568,8 @@ class DashboardGenerator:
 
             # 데이터 레이블 추가 (바깥쪽 끝에, 설명선과 항목이름 포함)
             try:
-                from openpyxl.chart.label import DataLabelList
                 if len(budget_chart.series) > 0:
-                    budget_chart.series[0].dLbls = DataLabelList()
-                    budget_chart.series[0].dLbls.showCatName = True  # 항목이름 표시
-                    budget_chart.series[0].dLbls.showVal = True      # 값 표시
-                    budget_chart.series[0].dLbls.showSerName = False # 계열 이름 제거
-                    budget_chart.series[0].dLbls.showLegendKey = False # 범례 표지 제거
-                    budget_chart.series[0].dLbls.showLeaderLines = True  # 설명선 표시
-                    budget_chart.series[0].dLbls.position = 'outEnd'    # 바깥쪽 끝에 배치
+                    budget_chart.series[0].dLbls = self._create_bar_data_labels()
             except Exception as label_e:
                 logging.warning(f"예산잔액 차트 데이터 레이블 적용 실패: {str(label_e)}")
 
@@ -2714,7 +2598,6 @@ class DashboardGenerator:
 
             # KPI와 동일한 색상 적용
             try:
-                from openpyxl.drawing.fill import SolidColorFillProperties
                 if len(execution_chart.series) > 0:
                     execution_chart.series[0].graphicalProperties.solidFill = SolidColorFillProperties(self.color_palette['secondary_green'])
             except Exception as color_e:
@@ -2722,15 +2605,8 @@ class DashboardGenerator:
 
             # 데이터 레이블 추가 (바깥쪽 끝에, 설명선과 항목이름 포함)
             try:
-                from openpyxl.chart.label import DataLabelList
                 if len(execution_chart.series) > 0:
-                    execution_chart.series[0].dLbls = DataLabelList()
-                    execution_chart.series[0].dLbls.showCatName = True  # 항목이름 표시
-                    execution_chart.series[0].dLbls.showVal = True      # 값 표시
-                    execution_chart.series[0].dLbls.showSerName = False # 계열 이름 제거
-                    execution_chart.series[0].dLbls.showLegendKey = False # 범례 표지 제거
-                    execution_chart.series[0].dLbls.showLeaderLines = True  # 설명선 표시
-                    execution_chart.series[0].dLbls.position = 'outEnd'    # 바깥쪽 끝에 배치
+                    execution_chart.series[0].dLbls = self._create_bar_data_labels()
             except Exception as label_e:
                 logging.warning(f"집행률 차트 데이터 레이블 적용 실패: {str(label_e)}")
 
@@ -2742,80 +2618,48 @@ class DashboardGenerator:
         except Exception as e:
             logging.error(f"예산과목별 지표 그래프 생성 중 오류: {str(e)}")
 
-    def _find_budget_item_row_in_total_sheet(self, total_sheet_data: pd.DataFrame, budget_item: str) -> int:
-        '''총액 시트에서 특정 예산과목의 행 번호를 찾습니다.'''
+    def _create_bar_data_labels(self) -> DataLabelList:
+        '''예산과목별 막대그래프용 데이터 레이블 (바깥쪽 끝, 설명선과 항목이름 포함)을 한 번에 생성합니다.'''
+        return DataLabelList(
+            showCatName=True,      # 항목이름 표시
+            showVal=True,          # 값 표시
+            showSerName=False,     # 계열 이름 제거
+            showLegendKey=False,   # 범례 표지 제거
+            showLeaderLines=True,  # 설명선 표시
+            dLblPos='outEnd'       # 바깥쪽 끝에 배치
+        )
+
+    def _build_budget_item_row_index(self, total_sheet_data: pd.DataFrame) -> dict:
+        '''총액 시트의 예산과목 → Excel 행 번호 조회 테이블을 만듭니다. (중복 시 첫 번째 행)'''
         try:
-            for idx, row in total_sheet_data.iterrows():
-                if row['예산과목'] == budget_item:
-                    return idx + 2  # DataFrame 인덱스 + 헤더 행(1) + Excel 1-based(1)
-            return None
+            # DataFrame 인덱스 + 헤더 행(1) + Excel 1-based(1)
+            excel_rows = pd.Series(total_sheet_data.index + 2, index=total_sheet_data['예산과목'].to_numpy())
+            excel_rows = excel_rows[~excel_rows.index.duplicated(keep='first')]
+            return excel_rows.to_dict()
         except Exception as e:
             logging.error(f"예산과목 행 찾기 중 오류: {str(e)}")
-            return None
+            return {}
 
     def _create_modern_execution_rate_chart(self, worksheet, excel_refs: dict):
         '''현대적 스타일의 집행률 비교 차트를 생성합니다. (총액 시트 참조)'''
         try:
-            from openpyxl.chart import BarChart, Reference
-            from openpyxl.styles import Font, PatternFill, Border, Side
-
-            # 차트 데이터 준비 (반투명 회색 배경으로 고급스러움 추가)
-            chart_fill = PatternFill(start_color=self.color_palette['translucent_gray'],
-                                   end_color=self.color_palette['translucent_gray'], fill_type='solid')
-            
-            # 테두리 스타일 정의 (검정색)
-            dark_border = Border(
-                left=Side(style='thin', color='000000'),
-                right=Side(style='thin', color='000000'),
-                top=Side(style='thin', color='000000'),
-                bottom=Side(style='thin', color='000000')
-            )            # 집행률 차트 제목 추가 (D13에 차트 제목) - 위치 조정
+            # 집행률 차트 제목 추가 (D13에 차트 제목) - 위치 조정
             worksheet['D13'] = "집행률 비교"
-            worksheet['D13'].font = Font(name='맑은 고딕', size=16, bold=True, color=self.color_palette['silver_accent'])
-
-            # 위치 조정 (집행률 제목 아래 B14부터 시작)
-            worksheet['B14'] = "구분"
-            worksheet['C14'] = "집행률(%)"
-            worksheet['B14'].font = Font(name='맑은 고딕', size=12, bold=False, color=self.color_palette['white_text'])
-            worksheet['C14'].font = Font(name='맑은 고딕', size=12, bold=False, color=self.color_palette['white_text'])
-            worksheet['B14'].alignment = Alignment(horizontal='center', vertical='center')  # 헤더 가운데 정렬
-            worksheet['C14'].alignment = Alignment(horizontal='center', vertical='center')  # 헤더 가운데 정렬
-            worksheet['B14'].fill = chart_fill
-            worksheet['C14'].fill = chart_fill
-            worksheet['B14'].border = dark_border  # 검정색 테두리 적용
-            worksheet['C14'].border = dark_border  # 검정색 테두리 적용
-
-            # 총액 시트 참조 수식으로 데이터 설정 (위치 조정)
+            worksheet['D13'].font = self._section_title_font
+
+            # 총액 시트 참조 수식으로 데이터 설정 (집행률 제목 아래 B14부터 시작)
             if excel_refs['total_row_index'] is not None:
                 total_row = excel_refs['total_row_index']
-
-                worksheet['B15'] = "총액"
-                worksheet['C15'] = f'=ROUND((총액!{excel_refs["center_col"]}{total_row}+총액!{excel_refs["research_col"]}{total_row})/총액!{excel_refs["budget_col"]}{total_row}*100,1)'
-
-                worksheet['B16'] = "센터"
-                worksheet['C16'] = f'=ROUND(총액!{excel_refs["center_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)'
-
-                worksheet['B17'] = "심층연구"
-                worksheet['C17'] = f'=ROUND(총액!{excel_refs["research_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)'
+                data_rows = [
+                    ("총액", f'=ROUND((총액!{excel_refs["center_col"]}{total_row}+총액!{excel_refs["research_col"]}{total_row})/총액!{excel_refs["budget_col"]}{total_row}*100,1)'),
+                    ("센터", f'=ROUND(총액!{excel_refs["center_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)'),
+                    ("심층연구", f'=ROUND(총액!{excel_refs["research_col"]}{total_row}/총액!{excel_refs["budget_col"]}{total_row}*100,1)')
+                ]
             else:
                 # 기본값
-                worksheet['B15'] = "총액"
-                worksheet['C15'] = 0
-                worksheet['B16'] = "센터"
-                worksheet['C16'] = 0
-                worksheet['B17'] = "심층연구"
-                worksheet['C17'] = 0
-
-            # 데이터 셀 스타일링 (위치 조정)
-            for row in range(15, 18):
-                worksheet[f'B{row}'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['white_text'])
-                worksheet[f'C{row}'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['white_text'])
-                worksheet[f'B{row}'].alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                worksheet[f'C{row}'].alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                worksheet[f'B{row}'].fill = chart_fill
-                worksheet[f'C{row}'].fill = chart_fill
-                worksheet[f'B{row}'].border = dark_border  # 검정색 테두리 적용
-                worksheet[f'C{row}'].border = dark_border  # 검정색 테두리 적용
+                data_rows = [("총액", 0), ("센터", 0), ("심층연구", 0)]
+
+            self._write_chart_data_table(worksheet, 14, ("구분", "집행률(%)"), data_rows, self._table_header_font)
 
             # 막대 차트 생성 (제목과 축 이름 제거) # TODO: y축이 100 (100%)인 곳에 빨간색 선 추가
             chart = BarChart()
@@ -2834,9 +2678,6 @@ class DashboardGenerator:
 
             # KPI와 동일한 색상 적용
             try:
-                from openpyxl.drawing.fill import SolidColorFillProperties
-                from openpyxl.drawing.colors import ColorChoice
-
                 # 각 데이터 시리즈에 KPI 색상 적용
                 if len(chart.series) > 0:
                     series = chart.series[0]
@@ -2861,7 +2702,7 @@ class DashboardGenerator:
             chart.dataLabels.showSerName = False
             chart.dataLabels.showLegendKey = False  # 범례 표지 제거
             chart.dataLabels.position = "ctr"
-            chart.dataLabels.font = Font(name='맑은 고딕', size=13)
+            chart.dataLabels.font = self._data_label_font
 
             # 차트 위치 설정 (좌측 배치 - KPI 영역 아래로 이동)
             chart.anchor = "D14"
@@ -2873,74 +2714,45 @@ class DashboardGenerator:
         except Exception as e:
             logging.error(f"집행률 차트 생성 중 오류: {str(e)}")
 
+    def _write_chart_data_table(self, worksheet, start_row: int, header: tuple, data_rows: list,
+                                header_font=None, value_format: str = None):
+        '''차트 원본 데이터 표(구분/값 2열)를 B열부터 값과 스타일을 함께 기록합니다.'''
+        ws_cell = worksheet.cell
+        data_font = self._table_data_font
+        rows = [(header, header_font or data_font)] + [(values, data_font) for values in data_rows]
+
+        for offset, (values, font) in enumerate(rows):
+            row_num = start_row + offset
+            for col_idx, value in enumerate(values, start=2):
+                cell = ws_cell(row=row_num, column=col_idx, value=value)
+                cell.font = font
+                cell.alignment = self._center_alignment  # 가운데 정렬
+                cell.fill = self._gray_fill  # 반투명 회색 배경
+                cell.border = self._dark_border  # 검정색 테두리 적용
+            if offset > 0 and value_format:
+                cell.number_format = value_format
+
     def _create_modern_budget_vs_execution_chart(self, worksheet, excel_refs: dict):
         '''현대적 스타일의 예산 vs 집행 현황 차트를 생성합니다. (총액 시트 참조)'''
         try:
-            from openpyxl.chart import PieChart, Reference
-            from openpyxl.styles import Font, PatternFill, Border, Side
-
-            # 차트 데이터 준비 (반투명 회색 배경으로 고급스러움 추가)
-            chart_fill = PatternFill(start_color=self.color_palette['translucent_gray'],
-                                   end_color=self.color_palette['translucent_gray'], fill_type='solid')
-            
-            # 테두리 스타일 정의 (검정색)
-            dark_border = Border(
-                left=Side(style='thin', color='000000'),
-                right=Side(style='thin', color='000000'),
-                top=Side(style='thin', color='000000'),
-                bottom=Side(style='thin', color='000000')
-            )
-
             # 예산 배분 차트 제목 추가 (H13에 차트 제목) - 위치 조정
             worksheet['H13'] = "예산 배분 현황"
-            worksheet['H13'].font = Font(name='맑은 고딕', size=16, bold=True, color=self.color_palette['silver_accent'])
-
-            # 예산 배분 차트 데이터 (예산 배분 제목 아래 B20부터 시작) - 위치 조정
-            worksheet['B20'] = "구분"
-            worksheet['C20'] = "금액"
-            worksheet['B20'].font = Font(name='맑은 고딕', size=12, bold=True, color=self.color_palette['white_text'])
-            worksheet['C20'].font = Font(name='맑은 고딕', size=12, bold=True, color=self.color_palette['white_text'])
-            worksheet['B20'].alignment = Alignment(horizontal='center', vertical='center')  # 헤더 가운데 정렬
-            worksheet['C20'].alignment = Alignment(horizontal='center', vertical='center')  # 헤더 가운데 정렬
-            worksheet['B20'].fill = chart_fill
-            worksheet['C20'].fill = chart_fill
-            worksheet['B20'].border = dark_border  # 검정색 테두리 적용
-            worksheet['C20'].border = dark_border  # 검정색 테두리 적용
-
-            # 총액 시트 참조 수식으로 데이터 설정 (B21부터 시작) - 위치 조정, 천 단위 구분자 적용
+            worksheet['H13'].font = self._section_title_font
+
+            # 총액 시트 참조 수식으로 데이터 설정 (예산 배분 제목 아래 B20부터 시작) - 천 단위 구분자 적용
             if excel_refs['total_row_index'] is not None:
                 total_row = excel_refs['total_row_index']
-
-                worksheet['B21'] = "센터"
-                worksheet['C21'] = f'=총액!{excel_refs["center_col"]}{total_row}'
-
-                worksheet['B22'] = "심층연구"
-                worksheet['C22'] = f'=총액!{excel_refs["research_col"]}{total_row}'
-
-                worksheet['B23'] = "예산잔액"
-                worksheet['C23'] = f'=총액!{excel_refs["remaining_col"]}{total_row}'
+                data_rows = [
+                    ("센터", f'=총액!{excel_refs["center_col"]}{total_row}'),
+                    ("심층연구", f'=총액!{excel_refs["research_col"]}{total_row}'),
+                    ("예산잔액", f'=총액!{excel_refs["remaining_col"]}{total_row}')
+                ]
             else:
                 # 기본값
-                worksheet['B21'] = "센터"
-                worksheet['C21'] = 0
-                worksheet['B22'] = "심층연구"
-                worksheet['C22'] = 0
-                worksheet['B23'] = "예산잔액"
-                worksheet['C23'] = 0
-
-            # 데이터 셀 스타일링 (예산 배분 차트) - 천 단위 구분자 적용, 위치 조정
-            for row in range(20, 24):
-                worksheet[f'B{row}'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['white_text'])
-                worksheet[f'C{row}'].font = Font(name='맑은 고딕', size=11, color=self.color_palette['white_text'])
-                worksheet[f'B{row}'].alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                worksheet[f'C{row}'].alignment = Alignment(horizontal='center', vertical='center')  # 가운데 정렬
-                worksheet[f'B{row}'].fill = chart_fill
-                worksheet[f'C{row}'].fill = chart_fill
-                worksheet[f'B{row}'].border = dark_border  # 검정색 테두리 적용
-                worksheet[f'C{row}'].border = dark_border  # 검정색 테두리 적용
-                # 금액 컬럼에 천 단위 구분자 적용
-                if row >= 21:  # 데이터 행에만 적용 (헤더 제외)
-                    worksheet[f'C{row}'].number_format = '#,##0'
+                data_rows = [("센터", 0), ("심층연구", 0), ("예산잔액", 0)]
+
+            # 헤더도 데이터 행과 같은 폰트 사용 (금액 컬럼에만 천 단위 구분자)
+            self._write_chart_data_table(worksheet, 20, ("구분", "금액"), data_rows, None, value_format='#,##0')
 
             # 파이 차트 생성 (내부 제목 제거)
             chart = PieChart()
@@ -2956,9 +2768,6 @@ class DashboardGenerator:
 
             # KPI와 동일한 색상 적용 (파이 차트)
             try:
-                from openpyxl.drawing.fill import SolidColorFillProperties
-                from openpyxl.drawing.colors import ColorChoice
-
                 # 각 데이터 포인트에 KPI 색상 적용
                 if len(chart.series) > 0:
                     series = chart.series[0]
@@ -2982,32 +2791,7 @@ class DashboardGenerator:
             chart.dataLabels.showSerName = False
             chart.dataLabels.showLegendKey = False  # 범례 표지 제거
             chart.dataLabels.position = "ctr"
-            chart.dataLabels.font = Font(name='맑은 고딕', size=13)
-
-            # 차트 배경색 설정 (대시보드와 조화로운 어두운 회색)
-            try:
-                from openpyxl.drawing.fill import SolidColorFillProperties
-                from openpyxl.drawing.colors import RgbColor
-
-                # 차트 배경색 설정
-                chart_bg_color = self.color_palette['translucent_gray']  # 반투명 회색
-
-                # SolidColorFillProperties 올바른 사용법
-                solid_fill = SolidColorFillProperties()
-                solid_fill.srgbClr = RgbColor(chart_bg_color)
-
-                # 차트 전체 배경 설정
-                if hasattr(chart, 'chartSpace') and hasattr(chart.chartSpace, 'spPr'):
-                    chart.chartSpace.spPr.solidFill = solid_fill
-
-                # 플롯 영역 배경도 동일하게 설정
-                if hasattr(chart, 'plotArea') and hasattr(chart.plotArea, 'spPr'):
-                    plot_fill = SolidColorFillProperties()
-                    plot_fill.srgbClr = RgbColor(chart_bg_color)
-                    chart.plotArea.spPr.solidFill = plot_fill
-
-            except Exception as e:
-                logging.warning(f"차트 배경색 설정 실패: {str(e)}")
+            chart.dataLabels.font = self._data_label_font
 
             # 차트 위치 설정 (우측 배치 - KPI 영역 아래로 이동)
             chart.anchor = "H14"
@@ -3024,24 +2808,16 @@ class DashboardGenerator:
     def _apply_modern_dashboard_styling(self, worksheet):
         '''현대적 High-end Company 스타일의 대시보드 스타일링을 적용합니다.'''
         try:
-            from openpyxl.styles import PatternFill
-
             logging.info("현대적 대시보드 스타일링 적용 시작")
 
             # 전체적인 검정색 배경 재확인
-            black_fill = PatternFill(start_color=self.color_palette['primary_black'],
-                                   end_color=self.color_palette['primary_black'], fill_type='solid')
+            black_fill = self._black_fill
 
             # 빈 셀들에 검정색 배경 적용 (V열까지 확장) — 확장 행 수 300까지
-            for row in range(1, 301):
-                for col in range(1, 23):  # V열은 22번째 열이므로 23까지
-                    cell = worksheet.cell(row=row, column=col)
-                    # openpyxl 색상 인덱스가 다를 수 있으므로 빈 셀이거나 투명 배경인 경우 덮어쓰기
-                    try:
-                        is_default_fill = getattr(cell.fill, 'fill_type', None) is None or cell.fill.start_color.index in ('00000000', '000000')
-                    except Exception:
-                        is_default_fill = True
-                    if is_default_fill:
+            # 아직 없는 셀은 iter_rows가 스타일 없는 새 셀로 만들어 주므로 has_style 검사만으로 바로 채워짐
+            for row in worksheet.iter_rows(min_row=1, max_row=300, max_col=22):  # V열은 22번째 열
+                for cell in row:
+                    if not cell.has_style or self._is_default_fill(cell):
                         cell.fill = black_fill
 
             logging.info("현대적 대시보드 스타일링 적용 완료")
@@ -3049,31 +2825,30 @@ class DashboardGenerator:
         except Exception as e:
             logging.error(f"스타일링 적용 중 오류: {str(e)}")
 
+    def _is_default_fill(self, cell) -> bool:
+        '''셀 배경이 비어 있거나 투명(검정 인덱스)인지 확인합니다.'''
+        # openpyxl 색상 인덱스가 다를 수 있으므로 빈 셀이거나 투명 배경인 경우 덮어쓰기 대상
+        try:
+            return getattr(cell.fill, 'fill_type', None) is None or cell.fill.start_color.index in ('00000000', '000000')
+        except Exception:
+            return True
+
     def _add_section_divider(self, worksheet, start_cell: str, end_cell: str, label: str = ""):
         '''섹션 구분선을 추가합니다. (사용자 경험 개선)'''
         try:
-            from openpyxl.styles import PatternFill, Font, Alignment
-
             # 구분선 색상 (실버 그라데이션)
-            divider_fill = PatternFill(start_color=self.color_palette['silver_accent'],
-                                     end_color=self.color_palette['silver_accent'], fill_type='solid')
-
-            # 구분선 생성
-            start_col = start_cell[0]
-            end_col = end_cell[0]
-            row = start_cell[1:]
-
-            # 구분선 셀들에 골드 배경 적용
-            for col_ord in range(ord(start_col), ord(end_col) + 1):
-                col = chr(col_ord)
-                cell = f"{col}{row}"
-                worksheet[cell].fill = divider_fill
-
-                # 라벨이 있으면 중앙에 표시
-                if label and col == chr((ord(start_col) + ord(end_col)) // 2):
-                    worksheet[cell] = f"{label}"
-                    worksheet[cell].font = Font(name='맑은 고딕', size=10, bold=True, color=self.color_palette['primary_black'])
-                    worksheet[cell].alignment = Alignment(horizontal='center', vertical='center')
+            silver = self.color_palette['silver_accent']
+            divider_fill = PatternFill(start_color=silver, end_color=silver, fill_type='solid')
+
+            # 병합 영역은 좌상단 셀 스타일만 표시되므로 좌상단 셀에만 배경 적용
+            top_left = worksheet[start_cell]
+            top_left.fill = divider_fill
+
+            # 라벨이 있으면 병합 영역 가운데에 표시 (병합 시 좌상단 외 셀 값은 지워지므로 좌상단에 기록)
+            if label:
+                top_left.value = label
+                top_left.font = Font(name='맑은 고딕', size=10, bold=True, color=self.color_palette['primary_black'])
+                top_left.alignment = self._center_alignment
 
             # 구분선 병합
             worksheet.merge_cells(f'{start_cell}:{end_cell}')
@@ -3084,9 +2859,25 @@ class DashboardGenerator:
 class TotalSheetGenerator:
     '''총액 시트 생성 클래스 (센터와 심층연구로 지출액 분리)'''
 
+    # 빈 총액 시트 템플릿 (반환 시 호출부에서 수정할 수 있도록 복사본 사용)
+    _EMPTY_TOTAL = pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
+
     def __init__(self):
         self.budget_classification = BUDGET_CLASSIFICATION
 
+        # 예산과목 → (예산목, 세목) 역방향 조회 테이블 (중복 시 분류 순서상 첫 번째)
+        # 키와 값 문자열을 intern해 조회 시 동일 객체 비교로 끝나고 결과 컬럼도 같은 문자열 객체를 공유
+        self._budget_index = {}
+        for budget_category, category_data in self.budget_classification['budget_categories'].items():
+            budget_category = sys.intern(budget_category)
+            for subcategory, items in category_data['subcategories'].items():
+                hierarchy = (budget_category, sys.intern(subcategory))
+                for budget_item in items:
+                    self._budget_index.setdefault(sys.intern(budget_item), hierarchy)
+
+        # 예산과목 → 예산금액 조회 테이블 (Series로 한 번만 만들어 map에 재사용)
+        self._budget_amount_lookup = pd.Series(self.budget_classification['2025_budget_amounts'], dtype='int64')
+
     def generate_total_sheet(self, business_data: pd.DataFrame,
                            research_data: pd.DataFrame) -> pd.DataFrame:
         '''
@@ -3106,11 +2897,11 @@ class TotalSheetGenerator:
             # 1. 사업비와 연구비 데이터 집계
             business_summary = self._aggregate_business_expenses(business_data)
             research_summary = self._aggregate_research_expenses(research_data)
-            logging.info(f"데이터 집계 완료 - 사업비: {len(business_summary)}건, 연구비: {len(research_summary)}건")
+            logging.info("데이터 집계 완료 - 사업비: %d건, 연구비: %d건", len(business_summary), len(research_summary))
 
             # 2. 사업비 표와 동일한 전체 계층구조 생성
             hierarchical_data = self._create_full_hierarchical_structure()
-            logging.info(f"전체 계층구조 생성 완료: {len(hierarchical_data)}건")
+            logging.info("전체 계층구조 생성 완료: %d건", len(hierarchical_data))
 
             # 3. 각 예산과목에 센터/심층연구 지출액 매핑
             final_data = self._map_expenses_to_structure(hierarchical_data, business_summary, research_summary)
@@ -3121,95 +2912,91 @@ class TotalSheetGenerator:
             # 5. 총액 행 추가
             final_data_with_total = self._add_total_row(final_data_with_calculations)
 
-            logging.info(f"총액 시트 생성 완료: {len(final_data_with_total)}건")
+            logging.info("총액 시트 생성 완료: %d건", len(final_data_with_total))
             return final_data_with_total
 
         except Exception as e:
             logging.error(f"총액 시트 생성 중 오류: {str(e)}")
-            return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
+            return self._EMPTY_TOTAL.copy()
 
     def _aggregate_business_expenses(self, business_data: pd.DataFrame) -> pd.DataFrame:
         '''사업비 데이터를 예산과목별로 집계합니다.'''
         try:
             if business_data is None or business_data.empty:
-                return pd.DataFrame(columns=['예산과목', '센터'])
+                return _EMPTY_CENTER_SUMMARY
 
             # 지출액 컬럼 확인 (총지급액 또는 지출액)
             amount_column = '총지급액' if '총지급액' in business_data.columns else '지출액'
             if amount_column not in business_data.columns:
                 logging.error(f"사업비 데이터에 지출액 컬럼({amount_column})이 없습니다.")
-                return pd.DataFrame(columns=['예산과목', '센터'])
+                return _EMPTY_CENTER_SUMMARY
 
             # 예산과목별 지출액 집계
-            aggregated = business_data.groupby('예산과목')[amount_column].sum().reset_index()
+            # 키를 범주형으로 한 번 변환해 문자열 대신 정수 코드로 그룹화 (지출액 dtype은 원본 유지)
+            if business_data['예산과목'].dtype == object:
+                business_data = business_data.astype({'예산과목': 'category'}, copy=False)
+            # 결과는 예산과목 기준으로 매핑되므로 정렬 불필요 (범주형이면 실제 값만 집계)
+            aggregated = business_data.groupby('예산과목', sort=False, observed=True, as_index=False)[amount_column].sum()
             aggregated.columns = ['예산과목', '센터']
 
-            logging.info(f"사업비 집계 결과: {len(aggregated)}개 예산과목")
+            logging.info("사업비 집계 결과: %d개 예산과목", len(aggregated))
             return aggregated
 
         except Exception as e:
             logging.error(f"사업비 집계 중 오류: {str(e)}")
-            return pd.DataFrame(columns=['예산과목', '센터'])
+            return _EMPTY_CENTER_SUMMARY
 
     def _aggregate_research_expenses(self, research_data: pd.DataFrame) -> pd.DataFrame:
         '''연구비 데이터를 예산과목별로 집계합니다.'''
         try:
             if research_data is None or research_data.empty:
-                return pd.DataFrame(columns=['예산과목', '심층연구'])
+                return _EMPTY_RESEARCH_SUMMARY
 
             # 지출액 컬럼 확인 (총지급액 또는 지출액)
             amount_column = '총지급액' if '총지급액' in research_data.columns else '지출액'
             if amount_column not in research_data.columns:
                 logging.error(f"연구비 데이터에 지출액 컬럼({amount_column})이 없습니다.")
-                return pd.DataFrame(columns=['예산과목', '심층연구'])
+                return _EMPTY_RESEARCH_SUMMARY
 
             # 예산과목별 지출액 집계
-            aggregated = research_data.groupby('예산과목')[amount_column].sum().reset_index()
+            # 키를 범주형으로 한 번 변환해 문자열 대신 정수 코드로 그룹화 (지출액 dtype은 원본 유지)
+            if research_data['예산과목'].dtype == object:
+                research_data = research_data.astype({'예산과목': 'category'}, copy=False)
+            # 결과는 예산과목 기준으로 매핑되므로 정렬 불필요 (범주형이면 실제 값만 집계)
+            aggregated = research_data.groupby('예산과목', sort=False, observed=True, as_index=False)[amount_column].sum()
             aggregated.columns = ['예산과목', '심층연구']
 
-            logging.info(f"연구비 집계 결과: {len(aggregated)}개 예산과목")
+            logging.info("연구비 집계 결과: %d개 예산과목", len(aggregated))
             return aggregated
 
         except Exception as e:
             logging.error(f"연구비 집계 중 오류: {str(e)}")
-            return pd.DataFrame(columns=['예산과목', '심층연구'])
+            return _EMPTY_RESEARCH_SUMMARY
 
     def _merge_business_research_data(self, business_summary: pd.DataFrame,
                                     research_summary: pd.DataFrame) -> pd.DataFrame:
         '''사업비와 연구비 데이터를 예산과목 기준으로 통합합니다.'''
         try:
-            # 모든 예산과목 목록 생성
-            all_budget_items = set()
-            if not business_summary.empty:
-                all_budget_items.update(business_summary['예산과목'].tolist())
-            if not research_summary.empty:
-                all_budget_items.update(research_summary['예산과목'].tolist())
-
-            # 기본 DataFrame 생성
-            result_data = []
-            for budget_item in sorted(all_budget_items):
-                # 사업비 지출액 (센터)
-                center_expense = 0
-                if not business_summary.empty:
-                    center_row = business_summary[business_summary['예산과목'] == budget_item]
-                    if not center_row.empty:
-                        center_expense = center_row['센터'].iloc[0]
-
-                # 연구비 지출액 (심층연구)
-                research_expense = 0
-                if not research_summary.empty:
-                    research_row = research_summary[research_summary['예산과목'] == budget_item]
-                    if not research_row.empty:
-                        research_expense = research_row['심층연구'].iloc[0]
-
-                result_data.append({
-                    '예산과목': budget_item,
-                    '센터': center_expense,
-                    '심층연구': research_expense
-                })
+            # 예산과목 기준 외부 병합 (한쪽에만 있는 예산과목의 지출액은 0)
+            center = (business_summary[['예산과목', '센터']] if not business_summary.empty
+                      else pd.DataFrame({'예산과목': pd.Series(dtype=object), '센터': pd.Series(dtype='int64')}))
+            research = (research_summary[['예산과목', '심층연구']] if not research_summary.empty
+                        else pd.DataFrame({'예산과목': pd.Series(dtype=object), '심층연구': pd.Series(dtype='int64')}))
+
+            result_df = (
+                center.drop_duplicates('예산과목')
+                .merge(research.drop_duplicates('예산과목'), on='예산과목', how='outer')
+                .fillna({'센터': 0, '심층연구': 0})
+                .sort_values('예산과목', kind='mergesort')
+                .reset_index(drop=True)
+            )
 
-            result_df = pd.DataFrame(result_data)
-            logging.info(f"데이터 통합 완료: {len(result_df)}개 예산과목")
+            # 병합 결측으로 실수형이 된 정수 지출액은 원래 정수형으로 복원
+            for column, source in (('센터', center), ('심층연구', research)):
+                if pd.api.types.is_integer_dtype(source[column]):
+                    result_df[column] = result_df[column].astype(source[column].dtype)
+
+            logging.info("데이터 통합 완료: %d개 예산과목", len(result_df))
             return result_df
 
         except Exception as e:
@@ -3219,56 +3006,45 @@ class TotalSheetGenerator:
     def _create_full_hierarchical_structure(self) -> pd.DataFrame:
         '''사업비 표와 완전히 동일한 전체 계층구조를 생성합니다.'''
         try:
-            hierarchical_data = []
+            budget_categories, subcategories, budget_items = [], [], []
 
-            # 예산 분류 구조를 순회하면서 모든 항목 생성
+            # 예산 분류 구조를 순회하면서 컬럼별 목록을 한 번에 구성
             for budget_category, category_data in self.budget_classification['budget_categories'].items():
                 for subcategory, items in category_data['subcategories'].items():
-                    for budget_item in items:
-                        hierarchical_data.append({
-                            '예산목': budget_category,
-                            '세목': subcategory,
-                            '예산과목': budget_item,
-                            '센터': 0,  # 기본값 0으로 초기화
-                            '심층연구': 0  # 기본값 0으로 초기화
-                        })
-
-            result_df = pd.DataFrame(hierarchical_data)
-            logging.info(f"전체 계층구조 생성 완료: {len(result_df)}건")
+                    budget_categories.extend([budget_category] * len(items))
+                    subcategories.extend([subcategory] * len(items))
+                    budget_items.extend(items)
+
+            # 타입이 정해진 배열로 미리 만들어 dtype 추론과 생성자 복사를 생략
+            item_count = len(budget_items)
+            result_df = pd.DataFrame({
+                '예산목': np.array(budget_categories, dtype=object),
+                '세목': np.array(subcategories, dtype=object),
+                '예산과목': np.array(budget_items, dtype=object),
+                '센터': np.zeros(item_count, dtype=np.int64),  # 기본값 0으로 초기화
+                '심층연구': np.zeros(item_count, dtype=np.int64)  # 기본값 0으로 초기화
+            }, copy=False)
+            logging.info("전체 계층구조 생성 완료: %d건", len(result_df))
             return result_df
 
         except Exception as e:
             logging.error(f"전체 계층구조 생성 중 오류: {str(e)}")
-            return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
+            return self._EMPTY_TOTAL.copy()
 
     def _map_expenses_to_structure(self, hierarchical_data: pd.DataFrame,
                                  business_summary: pd.DataFrame,
                                  research_summary: pd.DataFrame) -> pd.DataFrame:
-        '''전체 계층구조에 센터/심층연구 지출액을 매핑합니다.'''
+        '''전체 계층구조에 센터/심층연구 지출액을 매핑합니다. (호출부에서 새로 만든 hierarchical_data를 직접 채움)'''
         try:
-            result_data = hierarchical_data.copy()
+            result_data = hierarchical_data
 
             # 사업비 지출액 매핑 (센터)
             if not business_summary.empty:
-                for _, row in business_summary.iterrows():
-                    budget_item = row['예산과목']
-                    center_expense = row['센터']
-
-                    # 해당 예산과목의 행을 찾아서 센터 지출액 업데이트
-                    mask = result_data['예산과목'] == budget_item
-                    if mask.any():
-                        result_data.loc[mask, '센터'] = center_expense
+                result_data['센터'] = self._map_amounts_by_budget_item(result_data, business_summary, '센터')
 
             # 연구비 지출액 매핑 (심층연구)
             if not research_summary.empty:
-                for _, row in research_summary.iterrows():
-                    budget_item = row['예산과목']
-                    research_expense = row['심층연구']
-
-                    # 해당 예산과목의 행을 찾아서 심층연구 지출액 업데이트
-                    mask = result_data['예산과목'] == budget_item
-                    if mask.any():
-                        result_data.loc[mask, '심층연구'] = research_expense
+                result_data['심층연구'] = self._map_amounts_by_budget_item(result_data, research_summary, '심층연구')
 
             logging.info("지출액 매핑 완료")
             return result_data
@@ -3277,48 +3053,57 @@ class TotalSheetGenerator:
             logging.error(f"지출액 매핑 중 오류: {str(e)}")
             return hierarchical_data
 
+    def _map_amounts_by_budget_item(self, target: pd.DataFrame, summary: pd.DataFrame, column: str) -> pd.Series:
+        '''집계 결과의 지출액을 예산과목 기준으로 target에 매핑합니다. (매칭되지 않은 예산과목은 기존 값 유지)'''
+        amounts = summary.drop_duplicates('예산과목', keep='last').set_index('예산과목')[column]
+        mapped = target['예산과목'].map(amounts)
+
+        if mapped.isna().any():
+            mapped = mapped.fillna(target[column])
+            # 정수 지출액이 결측 처리로 실수형이 되지 않도록 원래 정수형 유지
+            if pd.api.types.is_integer_dtype(amounts) and pd.api.types.is_integer_dtype(target[column]):
+                mapped = mapped.astype(target[column].dtype)
+
+        return mapped
+
     def _create_hierarchical_structure(self, total_data: pd.DataFrame) -> pd.DataFrame:
         '''예산과목 데이터를 계층적 구조(예산목-세목-예산과목)로 변환합니다.'''
         try:
             if total_data.empty:
-                return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
-
-            hierarchical_data = []
-
-            for _, row in total_data.iterrows():
-                budget_item = row['예산과목']
-                center_expense = row['센터']
-                research_expense = row['심층연구']
-
-                # 예산 분류에서 해당 예산과목의 계층 정보 찾기
-                budget_category, subcategory = self._find_budget_hierarchy(budget_item)
-
-                hierarchical_data.append({
-                    '예산목': budget_category,
-                    '세목': subcategory,
-                    '예산과목': budget_item,
-                    '센터': center_expense,
-                    '심층연구': research_expense
-                })
-
-            result_df = pd.DataFrame(hierarchical_data)
-            logging.info(f"계층적 구조 변환 완료: {len(result_df)}건")
+                return self._EMPTY_TOTAL.copy()
+
+            # 예산과목을 정수 코드로 변환해 고유 예산과목만 계층 정보를 조회한 뒤 코드로 펼침
+            budget_items = total_data['예산과목'].to_numpy()
+            codes, unique_items = pd.factorize(budget_items, use_na_sentinel=False)
+            unique_categories = np.empty(len(unique_items), dtype=object)
+            unique_subcategories = np.empty(len(unique_items), dtype=object)
+            for code, budget_item in enumerate(unique_items):
+                unique_categories[code], unique_subcategories[code] = self._find_budget_hierarchy(budget_item)
+
+            # 코드 인덱싱으로 새로 만든 배열과 입력 컬럼 배열을 복사 없이 그대로 사용 (입력은 내부 병합 결과)
+            result_df = pd.DataFrame({
+                '예산목': unique_categories[codes],
+                '세목': unique_subcategories[codes],
+                '예산과목': budget_items,
+                '센터': total_data['센터'].to_numpy(),
+                '심층연구': total_data['심층연구'].to_numpy()
+            }, copy=False)
+            logging.info("계층적 구조 변환 완료: %d건", len(result_df))
             return result_df
 
         except Exception as e:
             logging.error(f"계층적 구조 변환 중 오류: {str(e)}")
-            return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
+            return self._EMPTY_TOTAL.copy()
 
     def _find_budget_hierarchy(self, budget_item: str) -> tuple:
         '''예산과목에서 예산목과 세목을 찾습니다.'''
         try:
-            for budget_category, category_data in self.budget_classification['budget_categories'].items():
-                for subcategory, items in category_data['subcategories'].items():
-                    if budget_item in items:
-                        return budget_category, subcategory
+            hierarchy = self._budget_index.get(budget_item)
+            if hierarchy is not None:
+                return hierarchy
 
             # 찾지 못한 경우 기본값 반환
-            logging.warning(f"예산과목 '{budget_item}'의 계층 정보를 찾을 수 없습니다.")
+            logging.warning("예산과목 '%s'의 계층 정보를 찾을 수 없습니다.", budget_item)
             return '기타', '기타'
 
         except Exception as e:
@@ -3326,79 +3111,94 @@ class TotalSheetGenerator:
             return '기타', '기타'
 
     def _add_budget_calculations(self, hierarchical_data: pd.DataFrame) -> pd.DataFrame:
-        '''예산금액, 예산잔액, 집행률을 계산하여 추가합니다.'''
-        try:
-            if hierarchical_data.empty:
-                return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
-
-            result_data = hierarchical_data.copy()
-            default_budgets = self.budget_classification['2025_budget_amounts']
+        '''
+        예산금액, 예산잔액, 집행률을 계산하여 추가합니다.
+        호출부에서 새로 만든 hierarchical_data에 컬럼을 직접 추가합니다. (복사하지 않음)
+        예산 정보 조회와 컬럼 정렬만 예외 처리하고, 금액 계산 오류는 generate_total_sheet에서 처리합니다.
+        '''
+        if hierarchical_data.empty:
+            return self._EMPTY_TOTAL.copy()
 
-            # 예산금액 설정
-            result_data['예산금액'] = result_data['예산과목'].apply(
-                lambda x: self._get_budget_amount(x, default_budgets)
-            )
+        try:
+            result_data = hierarchical_data
 
-            # 예산잔액 계산 (예산금액 - 센터 - 심층연구)
-            result_data['예산잔액'] = (result_data['예산금액'] -
-                                   result_data['센터'] -
-                                   result_data['심층연구'])
+            # 예산금액 설정 (예산 정보가 없는 예산과목은 0)
+            # 총액 시트 컬럼 위치에 바로 삽입해 마지막 컬럼 재정렬이 필요 없도록 함
+            budget_amounts = result_data['예산과목'].map(self._budget_amount_lookup).fillna(0).astype('int64')
+            if '예산금액' in result_data.columns:
+                result_data['예산금액'] = budget_amounts
+            else:
+                result_data.insert(TOTAL_SHEET_COLUMNS.index('예산금액'), '예산금액', budget_amounts)
+        except Exception as e:
+            logging.error(f"예산 계산 중 오류: {str(e)}")
+            return self._EMPTY_TOTAL.copy()
 
-            # 집행률 계산 ((센터 + 심층연구) / 예산금액 * 100)
-            result_data['집행률'] = result_data.apply(
-                lambda row: f"{((row['센터'] + row['심층연구']) / row['예산금액'] * 100):.0f}"
-                if row['예산금액'] > 0 else "0", axis=1
-            )
+        # 세 금액 컬럼을 한 번만 읽어 예산잔액과 집행률을 함께 계산
+        budget = result_data['예산금액'].to_numpy()
+        center = result_data['센터'].to_numpy()
+        research = result_data['심층연구'].to_numpy()
 
-            # 컬럼 순서 정렬
-            result_data = result_data[TOTAL_SHEET_COLUMNS]
+        # 예산잔액 계산 (예산금액 - 센터 - 심층연구)
+        result_data['예산잔액'] = budget - center - research
 
-            logging.info(f"예산 계산 완료: {len(result_data)}건")
-            return result_data
+        # 집행률 계산 ((센터 + 심층연구) / 예산금액 * 100, 정수 % 문자열)
+        rate = self._calculate_execution_rates(center + research, budget)
+        result_data['집행률'] = pd.Series(rate, index=result_data.index).astype(str)
 
-        except Exception as e:
+        # 컬럼 순서 정렬 (이미 같은 순서면 재선택 복사 생략)
+        try:
+            if list(result_data.columns) != TOTAL_SHEET_COLUMNS:
+                result_data = result_data[TOTAL_SHEET_COLUMNS]
+        except KeyError as e:
             logging.error(f"예산 계산 중 오류: {str(e)}")
-            return pd.DataFrame(columns=TOTAL_SHEET_COLUMNS)
+            return self._EMPTY_TOTAL.copy()
 
-    def _get_budget_amount(self, budget_item: str, default_budgets: dict) -> int:
-        '''예산과목의 예산금액을 반환합니다.'''
-        return default_budgets.get(budget_item, 0)
+        logging.info("예산 계산 완료: %d건", len(result_data))
+        return result_data
 
-    def _add_total_row(self, final_data: pd.DataFrame) -> pd.DataFrame:
-        '''총액 행을 추가합니다.'''
-        try:
-            if final_data.empty:
-                return final_data
-
-            # 총액 계산
-            total_budget = final_data['예산금액'].sum()
-            total_center = final_data['센터'].sum()
-            total_research = final_data['심층연구'].sum()
-            total_remaining = total_budget - total_center - total_research
-            total_execution_rate = f"{((total_center + total_research) / total_budget * 100):.0f}" if total_budget > 0 else "0"
-
-            # 총액 행 생성
-            total_row = {
-                '예산목': '총액',
-                '세목': '',
-                '예산과목': '',
-                '예산금액': total_budget,
-                '센터': total_center,
-                '심층연구': total_research,
-                '예산잔액': total_remaining,
-                '집행률': total_execution_rate
-            }
+    def _calculate_execution_rates(self, used: np.ndarray, budget: np.ndarray) -> np.ndarray:
+        '''지출액/예산금액 집행률을 정수 %로 계산합니다. (예산금액이 0 이하면 0)'''
+        # np.rint는 f"{x:.0f}"와 같은 짝수 반올림이므로 기존 문자열 표기와 동일
+        has_budget = budget > 0
+        ratio = (used / np.where(has_budget, budget, 1) * 100).astype(np.float64)  # object 배열도 실수로 변환
+        return np.where(has_budget, np.rint(ratio), 0).astype(np.int64)
 
-            # 총액 행 추가
-            result_data = pd.concat([final_data, pd.DataFrame([total_row])], ignore_index=True)
+    def _add_total_row(self, final_data: pd.DataFrame) -> pd.DataFrame:
+        '''총액 행을 추가합니다. (generate_total_sheet에서 새로 만든 프레임에 직접 추가, 행 추가 실패 시 총액 행 없이 반환)'''
+        if final_data.empty:
+            return final_data
 
-            logging.info("총액 행 추가 완료")
-            return result_data
+        # 총액 계산 (세 금액 컬럼을 2차원 배열 한 번의 축 합산으로 계산, 결측값은 DataFrame.sum처럼 제외)
+        amount_columns = ['예산금액', '센터', '심층연구']
+        totals = np.nansum(final_data[amount_columns].to_numpy(), axis=0)
+        # 정수/실수 컬럼이 섞이면 합계가 실수로 통일되므로 각 컬럼의 원래 타입으로 되돌림
+        # 정수 컬럼은 int64로 되돌림 (int32 등 좁은 타입으로 되돌리면 총액이 범위를 넘어 값이 바뀔 수 있음)
+        total_budget, total_center, total_research = (
+            (np.int64 if pd.api.types.is_integer_dtype(final_data[column]) else final_data[column].dtype.type)(total)
+            for column, total in zip(amount_columns, totals)
+        )
+        total_remaining = total_budget - total_center - total_research
+        total_execution_rate = str(self._calculate_execution_rates(
+            np.array([total_center + total_research]), np.array([total_budget])
+        )[0])
+
+        # 총액 행 생성 (_add_budget_calculations가 보장하는 TOTAL_SHEET_COLUMNS 순서의 튜플)
+        total_row = (
+            '총액', '', '',
+            total_budget, total_center, total_research, total_remaining, total_execution_rate
+        )
 
+        # 총액 행 추가 (1행 DataFrame을 만들어 concat하지 않고 마지막 행으로 바로 기록)
+        # 전체 계층구조 프레임은 0..N-1 인덱스이므로 len()이 항상 새 행 번호
+        try:
+            final_data.loc[len(final_data)] = total_row
         except Exception as e:
             logging.error(f"총액 행 추가 중 오류: {str(e)}")
             return final_data
 
+        logging.info("총액 행 추가 완료")
+        return final_data
+
 
 class InteractivePivotGenerator:
     '''xlwings를 사용한 대화형 피벗 테이블 생성 클래스'''
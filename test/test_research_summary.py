@@ -0,0 +1,47 @@
+'''연구비 요약 시트 생성기 회귀 테스트 (python -m unittest discover -s test)'''
+
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from research_core import SummarySheetGenerator
+
+SAMPLE_EXPORT_FILE = os.path.join(os.path.dirname(__file__), '지출요구 조회_20250710_092131.xlsx')
+
+
+class TestResearchExpenseKeywords(unittest.TestCase):
+    '''예산과목이 모두 결측일 때 적요 키워드로 연구비 지출액을 찾는지 검증'''
+
+    @classmethod
+    def setUpClass(cls):
+        research_data = pd.read_excel(SAMPLE_EXPORT_FILE)
+        research_data['예산과목'] = np.nan
+        research_data['적요'] = research_data['적요'].astype(str) + ' 연구개발비 기자재'
+        cls.research_data = research_data
+        cls.expected = float(pd.to_numeric(research_data['총지급액'], errors='coerce').fillna(0).sum())
+
+    def test_all_missing_budget_items_are_string_categories(self):
+        '''전체가 결측인 예산과목도 문자열 범주로 변환되어 키워드 매칭 지출액이 유지되는지 확인합니다.'''
+        generator = SummarySheetGenerator()
+        # generate_research_summary_sheet와 같이 총지급액을 먼저 숫자로 변환
+        categorized = generator._categorize_budget_columns(self.research_data).assign(
+            총지급액=pd.to_numeric(self.research_data['총지급액'], errors='coerce').fillna(0)
+        )
+
+        self.assertEqual(categorized['예산과목'].cat.categories.dtype, object)
+        self.assertEqual(generator._calculate_research_expense(categorized, '연구개발비'), self.expected)
+        self.assertEqual(generator._calculate_research_expense(categorized, '자산취득비'), self.expected)
+
+    def test_research_summary_rows_keep_keyword_expenses(self):
+        '''연구비 시트 총합 표의 연구개발비/자산취득비 행에 적요 키워드 지출액이 반영되는지 확인합니다.'''
+        summary = SummarySheetGenerator().generate_research_summary_sheet(self.research_data)
+
+        for budget_item in ('연구개발비', '자산취득비'):
+            expense = summary.loc[summary['예산과목'] == budget_item, '지출액'].iloc[0]
+            self.assertEqual(float(expense), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
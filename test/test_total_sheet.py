@@ -0,0 +1,45 @@
+'''총액 시트 생성기 회귀 테스트 (python -m unittest discover -s test)'''
+
+import os
+import unittest
+
+import pandas as pd
+
+from config import TOTAL_SHEET_COLUMNS
+from research_core import TotalSheetGenerator
+
+SAMPLE_BUDGET_FILE = os.path.join(os.path.dirname(__file__), '연구비_집행관리.xlsx')
+
+
+class TestGenerateTotalSheet(unittest.TestCase):
+    '''generate_total_sheet 결과(전체 계층구조 + 총액 행) 검증'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = TotalSheetGenerator()
+        cls.business_data = pd.read_excel(SAMPLE_BUDGET_FILE, sheet_name='집행관리(사업비)')
+        cls.research_data = pd.read_excel(SAMPLE_BUDGET_FILE, sheet_name='집행관리(연구비)')
+        cls.total_sheet = cls.generator.generate_total_sheet(cls.business_data, cls.research_data)
+
+    def test_structure_and_total_row(self):
+        '''모든 예산과목 행 뒤에 총액 행 하나가 붙고 컬럼 순서가 유지되는지 확인합니다.'''
+        self.assertEqual(list(self.total_sheet.columns), TOTAL_SHEET_COLUMNS)
+        self.assertEqual(len(self.total_sheet), len(self.generator._budget_index) + 1)
+        self.assertEqual(self.total_sheet['예산목'].iloc[-1], '총액')
+        self.assertEqual(self.total_sheet['예산금액'].dtype, 'int64')
+
+    def test_total_row_matches_mapped_expenses(self):
+        '''총액 행이 각 행의 합계이고, 센터/심층연구 합계가 분류된 예산과목 지출액과 같은지 확인합니다.'''
+        rows = self.total_sheet.iloc[:-1]
+        total_row = self.total_sheet.iloc[-1]
+        for column in ('예산금액', '센터', '심층연구', '예산잔액'):
+            self.assertEqual(total_row[column], rows[column].sum())
+
+        known_items = list(self.generator._budget_index)
+        for column, source in (('센터', self.business_data), ('심층연구', self.research_data)):
+            expected = source.loc[source['예산과목'].isin(known_items), '총지급액'].sum()
+            self.assertEqual(total_row[column], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()